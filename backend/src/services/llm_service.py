@@ -386,6 +386,10 @@ async def stream_ai_response(
             # Skip empty chunks
             if content:
                 yield TokenEvent(content=content)
+                # Yield to the event loop so the server can flush this token
+                # before the next one when the provider delivers a burst of
+                # already-buffered chunks
+                await asyncio.sleep(0)
 
         # Yield completion event
         logger.info(f"Stream completed successfully using model: {model_to_use}")
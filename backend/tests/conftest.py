@@ -8,13 +8,26 @@ Provides:
 - Environment variable mocking for test isolation
 """
 
+import asyncio
 import os
-from typing import Generator
+import sys
+from typing import TYPE_CHECKING, Generator, List
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import yaml
 from fastapi.testclient import TestClient
-from openapi_core import Spec
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from openapi_core import Spec
+
+# Model configuration every test runs with (see mock_test_env_vars)
+TEST_MODELS_ENV = (
+    '[{"id": "gpt-3.5-turbo", "name": "GPT-3.5 Turbo", '
+    '"description": "Fast and efficient for most tasks", "provider": "openai", "default": true}]'
+)
+TEST_OPENAI_API_KEY = "test-api-key-12345"
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -34,32 +47,47 @@ def mock_test_env_vars(monkeypatch):
 
     # Set predictable test values BEFORE any imports that load config
     # Use unified MODELS format with provider field
-    monkeypatch.setenv(
-        "MODELS",
-        '[{"id": "gpt-3.5-turbo", "name": "GPT-3.5 Turbo", '
-        '"description": "Fast and efficient for most tasks", "provider": "openai", "default": true}]'
-    )
-    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key-12345")
+    monkeypatch.setenv("MODELS", TEST_MODELS_ENV)
+    monkeypatch.setenv("OPENAI_API_KEY", TEST_OPENAI_API_KEY)
 
-    # Clear any cached LLM instances to force reload with new env vars
-    try:
-        import src.services.llm_service as llm_service
-        llm_service._llm_instance = None
-    except (ImportError, AttributeError):
-        pass  # Module not imported yet or no cache to clear
+    # No LLM cache to clear: providers build a fresh client on every call,
+    # so the env values above are picked up without a reset
 
     # Note: Individual tests can still override these with their own monkeypatch
     # if they need to test different configurations
 
 
 @pytest.fixture(scope="session")
-def openapi_spec() -> Spec:
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Event loop policy used by pytest-asyncio for async tests.
+
+    uvloop is installed with uvicorn[standard] everywhere except Windows;
+    fall back to the default asyncio policy where it is unavailable.
+
+    Returns:
+        uvloop.EventLoopPolicy, or the default asyncio policy
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def openapi_spec() -> "Spec":
     """
     Load OpenAPI specification for contract testing.
 
     Returns:
         openapi_core.Spec object for validating requests/responses
     """
+    # Imported lazily so only contract tests pay the openapi-core import cost
+    from openapi_core import Spec
+
     # Path to OpenAPI contract
     spec_path = os.path.join(
         os.path.dirname(__file__),
@@ -79,21 +107,93 @@ def openapi_spec() -> Spec:
     return Spec.from_dict(spec_dict)
 
 
-@pytest.fixture(scope="function")
-def client() -> Generator[TestClient, None, None]:
+@pytest.fixture(scope="session")
+def app() -> "FastAPI":
+    """
+    The FastAPI application under test.
+
+    main is imported on first use rather than at module level, keeping
+    collection lightweight for unit-only runs; after that the module cache
+    returns the same app for the rest of the session (once per xdist worker).
+
+    Returns:
+        FastAPI app from main.py
+    """
+    from main import app as fastapi_app
+
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(app: "FastAPI") -> Generator[TestClient, None, None]:
     """
     Create FastAPI TestClient for integration tests.
 
+    Session-scoped so app startup and the lifespan run once per test run.
+    Routes read configuration from the environment per request, so the
+    per-test env overrides in mock_test_env_vars still apply.
+
     Yields:
         TestClient instance for making test requests
     """
-    # Import app here (not at module level) to ensure env vars are set first
-    from main import app
-
     with TestClient(app) as test_client:
         yield test_client
 
 
+@pytest.fixture(scope="session")
+def available_models(client: TestClient) -> List[dict]:
+    """
+    Models listed by GET /api/v1/models under the default test configuration.
+
+    Session-scoped so tests that only need a valid model ID skip the extra
+    round-trip. Session fixtures are set up before the function-scoped
+    mock_test_env_vars, so the same environment is applied here explicitly.
+
+    Returns:
+        List of model dictionaries from the models endpoint
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("ANTHROPIC_API_KEY", raising=False)
+        mp.setenv("MODELS", TEST_MODELS_ENV)
+        mp.setenv("OPENAI_API_KEY", TEST_OPENAI_API_KEY)
+        response = client.get("/api/v1/models")
+
+    assert response.status_code == 200
+    return response.json()["models"]
+
+
+@pytest.fixture
+def mock_get_ai() -> Generator[AsyncMock, None, None]:
+    """
+    Mock the non-streaming LLM call used by POST /api/v1/messages.
+
+    Tests set return_value (a (response_text, model_used) tuple) or
+    side_effect on the yielded mock.
+
+    Yields:
+        AsyncMock patched over src.api.routes.messages.get_ai_response
+    """
+    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_stream_ai(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """
+    Mock the streaming LLM call used by POST /api/v1/messages with SSE.
+
+    The route iterates the call's result with ``async for``, so tests set
+    return_value to an async generator, or side_effect to an async generator
+    function when they need the call's keyword arguments.
+
+    Returns:
+        Mock installed over src.api.routes.messages.stream_ai_response
+    """
+    mock = Mock()
+    monkeypatch.setattr('src.api.routes.messages.stream_ai_response', mock)
+    return mock
+
+
 @pytest.fixture
 def sample_message_request() -> dict:
     """
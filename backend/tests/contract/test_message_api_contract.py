@@ -11,71 +11,24 @@ CRITICAL: These tests validate that frontend and backend agree on the contract.
 If these fail, it indicates a breaking mismatch between client and server.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from openapi_core import Spec, validate_request, validate_response
-from openapi_core.protocols import Request as OpenAPIRequest, Response as OpenAPIResponse
-from openapi_core.datatypes import RequestParameters, Headers
-from werkzeug.datastructures import ImmutableMultiDict
-
-
-class FastAPIOpenAPIRequest(OpenAPIRequest):
-    """
-    Adapter to convert FastAPI TestClient request to openapi-core Request protocol.
-    """
-    def __init__(self, fastapi_request, body: bytes):
-        self._request = fastapi_request
-        self._body = body
-
-    @property
-    def host_url(self) -> str:
-        # Override testserver with localhost:8000 to match OpenAPI spec
-        return "http://localhost:8000"
-
-    @property
-    def path(self) -> str:
-        return self._request.url.path
-
-    @property
-    def method(self) -> str:
-        return self._request.method.lower()
-
-    @property
-    def parameters(self) -> RequestParameters:
-        return RequestParameters(
-            query=ImmutableMultiDict(self._request.url.params.items()),
-            header=Headers(dict(self._request.headers)),
-            cookie=ImmutableMultiDict(),
-            path={}
-        )
-
-    @property
-    def body(self) -> bytes:
-        return self._body
+from __future__ import annotations
 
-    @property
-    def mimetype(self) -> str:
-        return self._request.headers.get('content-type', 'application/json')
+from typing import TYPE_CHECKING
 
+import orjson
+import pytest
+from fastapi.testclient import TestClient
 
-class FastAPIOpenAPIResponse(OpenAPIResponse):
-    """
-    Adapter to convert FastAPI TestClient response to openapi-core Response protocol.
-    """
-    def __init__(self, fastapi_response):
-        self._response = fastapi_response
-
-    @property
-    def data(self) -> bytes:
-        return self._response.content
-
-    @property
-    def status_code(self) -> int:
-        return self._response.status_code
+from tests.helpers.openapi import (
+    FastAPIOpenAPIRequest,
+    FastAPIOpenAPIResponse,
+    validate_request,
+    validate_response,
+)
+from tests.helpers.sse import parse_sse_stream
 
-    @property
-    def mimetype(self) -> str:
-        return self._response.headers.get('content-type', 'application/json').split(';')[0]
+if TYPE_CHECKING:
+    from openapi_core import Spec
 
 
 @pytest.mark.contract
@@ -94,15 +47,13 @@ def test_loopback_request_matches_contract(
 
     CRITICAL: If this fails, frontend and backend disagree on request format.
     """
-    import json
-
     # Prepare request body
-    body = json.dumps(sample_message_request).encode('utf-8')
+    body = orjson.dumps(sample_message_request)
 
     # Make the actual request
     response = client.post(
         "/api/v1/messages",
-        json=sample_message_request,
+        content=body,
         headers={"Content-Type": "application/json"}
     )
 
@@ -111,7 +62,7 @@ def test_loopback_request_matches_contract(
 
     # Validate request against OpenAPI spec
     # In openapi-core 0.18.2, validate_request returns None on success, or raises on error
-    result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
+    result = validate_request(openapi_request, openapi_spec)
 
     # If result is None, validation passed
     if result is not None:
@@ -134,7 +85,6 @@ def test_loopback_response_matches_contract(
 
     CRITICAL: If this fails, backend response doesn't match contract.
     """
-    import json
     from unittest.mock import patch, AsyncMock
 
     # Mock the LLM service to return predictable response
@@ -143,12 +93,12 @@ def test_loopback_response_matches_contract(
         mock_get_ai.return_value = ("This is an AI response.", "gpt-3.5-turbo")
 
         # Prepare request body
-        body = json.dumps(sample_message_request).encode('utf-8')
+        body = orjson.dumps(sample_message_request)
 
         # Make request
         response = client.post(
             "/api/v1/messages",
-            json=sample_message_request,
+            content=body,
             headers={"Content-Type": "application/json"}
         )
 
@@ -158,7 +108,7 @@ def test_loopback_response_matches_contract(
 
         # Validate response against OpenAPI spec
         # In openapi-core 0.18.2, validate_response returns None on success, or raises on error
-        result = validate_response(openapi_request, openapi_response, spec=openapi_spec, base_url="http://localhost:8000")
+        result = validate_response(openapi_request, openapi_response, openapi_spec)
 
         # If result is None, validation passed
         if result is not None:
@@ -183,13 +133,11 @@ def test_minimal_request_matches_contract(
 
     Validates that optional fields (conversationId, timestamp) are truly optional.
     """
-    import json
-
-    body = json.dumps(sample_message_minimal).encode('utf-8')
-    response = client.post("/api/v1/messages", json=sample_message_minimal)
+    body = orjson.dumps(sample_message_minimal)
+    response = client.post("/api/v1/messages", content=body, headers={"Content-Type": "application/json"})
 
     openapi_request = FastAPIOpenAPIRequest(response.request, body)
-    result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
+    result = validate_request(openapi_request, openapi_spec)
 
     if result is not None:
         assert not result.errors, f"Minimal request validation errors: {[str(e) for e in result.errors]}"
@@ -206,13 +154,11 @@ def test_special_characters_request_matches_contract(
 
     Validates FR-010: Backend accepts special characters, emoji, multi-byte characters.
     """
-    import json
-
-    body = json.dumps(sample_message_special_chars, ensure_ascii=False).encode('utf-8')
-    response = client.post("/api/v1/messages", json=sample_message_special_chars)
+    body = orjson.dumps(sample_message_special_chars)
+    response = client.post("/api/v1/messages", content=body, headers={"Content-Type": "application/json"})
 
     openapi_request = FastAPIOpenAPIRequest(response.request, body)
-    result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
+    result = validate_request(openapi_request, openapi_spec)
 
     if result is not None:
         assert not result.errors, f"Special chars request validation errors: {[str(e) for e in result.errors]}"
@@ -228,19 +174,17 @@ def test_error_response_matches_contract(
 
     Validates error response structure for invalid requests.
     """
-    import json
-
     # Send empty message (should trigger 400 error)
     invalid_request = {"message": ""}
-    body = json.dumps(invalid_request).encode('utf-8')
-    response = client.post("/api/v1/messages", json=invalid_request)
+    body = orjson.dumps(invalid_request)
+    response = client.post("/api/v1/messages", content=body, headers={"Content-Type": "application/json"})
 
     # Create OpenAPI request/response objects
     openapi_request = FastAPIOpenAPIRequest(response.request, body)
     openapi_response = FastAPIOpenAPIResponse(response)
 
     # Validate error response
-    result = validate_response(openapi_request, openapi_response, spec=openapi_spec, base_url="http://localhost:8000")
+    result = validate_response(openapi_request, openapi_response, openapi_spec)
 
     if result is not None:
         assert not result.errors, f"Error response validation errors: {[str(e) for e in result.errors]}"
@@ -267,8 +211,6 @@ def test_conversation_id_format_validated_by_contract(
     Valid format: conv-{uuid}
     Invalid formats: raw uuid, wrong prefix, malformed uuid
     """
-    import json
-
     test_cases = [
         # Valid cases - should pass contract validation
         {
@@ -295,14 +237,14 @@ def test_conversation_id_format_validated_by_contract(
     ]
 
     for case in test_cases:
-        body = json.dumps(case["request"]).encode('utf-8')
-        response = client.post("/api/v1/messages", json=case["request"])
+        body = orjson.dumps(case["request"])
+        response = client.post("/api/v1/messages", content=body, headers={"Content-Type": "application/json"})
 
         openapi_request = FastAPIOpenAPIRequest(response.request, body)
 
         if case["should_pass_contract"]:
             # Should pass validation without errors or exceptions
-            result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
+            result = validate_request(openapi_request, openapi_spec)
             if result is not None:
                 assert not result.errors, f"{case['description']}: Expected to pass contract but got errors: {[str(e) for e in result.errors]}"
         else:
@@ -311,7 +253,7 @@ def test_conversation_id_format_validated_by_contract(
             validation_failed = False
 
             try:
-                result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
+                result = validate_request(openapi_request, openapi_spec)
                 if result is not None and result.errors:
                     validation_failed = True
             except OpenAPIValidationError:
@@ -335,7 +277,6 @@ def test_all_message_fields_validated(
 
     CRITICAL: This prevents silent schema drift between frontend and backend.
     """
-    import json
     from unittest.mock import patch, AsyncMock
 
     # Mock the LLM service to return predictable response
@@ -350,15 +291,15 @@ def test_all_message_fields_validated(
             "timestamp": "2025-12-29T15:00:00.000Z"
         }
 
-        body = json.dumps(full_request).encode('utf-8')
-        response = client.post("/api/v1/messages", json=full_request)
+        body = orjson.dumps(full_request)
+        response = client.post("/api/v1/messages", content=body, headers={"Content-Type": "application/json"})
 
         openapi_request = FastAPIOpenAPIRequest(response.request, body)
         openapi_response = FastAPIOpenAPIResponse(response)
 
         # Validate both request and response
-        request_result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
-        response_result = validate_response(openapi_request, openapi_response, spec=openapi_spec, base_url="http://localhost:8000")
+        request_result = validate_request(openapi_request, openapi_spec)
+        response_result = validate_response(openapi_request, openapi_response, openapi_spec)
 
         if request_result is not None:
             assert not request_result.errors, f"Request with all fields failed validation: {[str(e) for e in request_result.errors]}"
@@ -389,7 +330,6 @@ def test_ai_response_matches_contract(
     Feature: 006-openai-langchain-chat User Story 1
     Expected: FAIL (LLM service not integrated into endpoint yet)
     """
-    import json
     from unittest.mock import patch, Mock, AsyncMock
 
     # Mock the LLM service to return predictable AI response
@@ -399,12 +339,12 @@ def test_ai_response_matches_contract(
 
         # Prepare request
         request_data = {"message": "Hello, how are you?"}
-        body = json.dumps(request_data).encode('utf-8')
+        body = orjson.dumps(request_data)
 
         # Make request
         response = client.post(
             "/api/v1/messages",
-            json=request_data,
+            content=body,
             headers={"Content-Type": "application/json"}
         )
 
@@ -413,12 +353,7 @@ def test_ai_response_matches_contract(
         openapi_response = FastAPIOpenAPIResponse(response)
 
         # Validate response against OpenAPI spec (v2.0.0)
-        result = validate_response(
-            openapi_request,
-            openapi_response,
-            spec=openapi_spec,
-            base_url="http://localhost:8000"
-        )
+        result = validate_response(openapi_request, openapi_response, openapi_spec)
 
         # Check validation result
         if result is not None:
@@ -450,7 +385,6 @@ def test_503_error_response_matches_contract(
     Validates that 503 error responses (AI service issues) match OpenAPI spec.
     """
     from unittest.mock import patch, AsyncMock
-    import json
     from src.services.llm_service import LLMAuthenticationError
 
     # Mock the LLM service to raise LLMAuthenticationError
@@ -460,12 +394,12 @@ def test_503_error_response_matches_contract(
 
         # Prepare request
         request_data = {"message": "Hello"}
-        body = json.dumps(request_data).encode('utf-8')
+        body = orjson.dumps(request_data)
 
         # Make request
         response = client.post(
             "/api/v1/messages",
-            json=request_data,
+            content=body,
             headers={"Content-Type": "application/json"}
         )
 
@@ -474,12 +408,7 @@ def test_503_error_response_matches_contract(
         openapi_response = FastAPIOpenAPIResponse(response)
 
         # Validate response against OpenAPI spec
-        result = validate_response(
-            openapi_request,
-            openapi_response,
-            spec=openapi_spec,
-            base_url="http://localhost:8000"
-        )
+        result = validate_response(openapi_request, openapi_response, openapi_spec)
 
         # Check validation result
         if result is not None:
@@ -512,7 +441,6 @@ def test_504_timeout_response_matches_contract(
     Validates that 504 timeout responses match OpenAPI spec.
     """
     from unittest.mock import patch, AsyncMock
-    import json
     from src.services.llm_service import LLMTimeoutError
 
     # Mock the LLM service to raise LLMTimeoutError
@@ -522,12 +450,12 @@ def test_504_timeout_response_matches_contract(
 
         # Prepare request
         request_data = {"message": "Hello"}
-        body = json.dumps(request_data).encode('utf-8')
+        body = orjson.dumps(request_data)
 
         # Make request
         response = client.post(
             "/api/v1/messages",
-            json=request_data,
+            content=body,
             headers={"Content-Type": "application/json"}
         )
 
@@ -536,12 +464,7 @@ def test_504_timeout_response_matches_contract(
         openapi_response = FastAPIOpenAPIResponse(response)
 
         # Validate response against OpenAPI spec
-        result = validate_response(
-            openapi_request,
-            openapi_response,
-            spec=openapi_spec,
-            base_url="http://localhost:8000"
-        )
+        result = validate_response(openapi_request, openapi_response, openapi_spec)
 
         # Check validation result
         if result is not None:
@@ -577,7 +500,6 @@ def test_message_request_with_model_field_matches_contract(
     - Valid model IDs are accepted
     - Response includes the model that was used
     """
-    import json
     from unittest.mock import patch, AsyncMock
 
     # Mock the LLM service
@@ -590,12 +512,12 @@ def test_message_request_with_model_field_matches_contract(
             "message": "Test message",
             "model": "gpt-4"
         }
-        body = json.dumps(request_data).encode('utf-8')
+        body = orjson.dumps(request_data)
 
         # Make request
         response = client.post(
             "/api/v1/messages",
-            json=request_data,
+            content=body,
             headers={"Content-Type": "application/json"}
         )
 
@@ -604,12 +526,12 @@ def test_message_request_with_model_field_matches_contract(
         openapi_response = FastAPIOpenAPIResponse(response)
 
         # Validate request against spec (model field should be accepted)
-        request_result = validate_request(openapi_request, spec=openapi_spec, base_url="http://localhost:8000")
+        request_result = validate_request(openapi_request, openapi_spec)
         if request_result is not None:
             assert not request_result.errors, f"Request with model field failed validation: {[str(e) for e in request_result.errors]}"
 
         # Validate response against spec
-        response_result = validate_response(openapi_request, openapi_response, spec=openapi_spec, base_url="http://localhost:8000")
+        response_result = validate_response(openapi_request, openapi_response, openapi_spec)
         if response_result is not None:
             assert not response_result.errors, f"Response validation failed: {[str(e) for e in response_result.errors]}"
 
@@ -631,7 +553,6 @@ def test_message_request_without_model_uses_default(
     When no model is specified, the backend should use the default model
     from configuration and return it in the response.
     """
-    import json
     from unittest.mock import patch, AsyncMock
 
     # Mock the LLM service
@@ -643,12 +564,12 @@ def test_message_request_without_model_uses_default(
         request_data = {
             "message": "Test message"
         }
-        body = json.dumps(request_data).encode('utf-8')
+        body = orjson.dumps(request_data)
 
         # Make request
         response = client.post(
             "/api/v1/messages",
-            json=request_data,
+            content=body,
             headers={"Content-Type": "application/json"}
         )
 
@@ -672,7 +593,6 @@ def test_invalid_model_id_returns_error(
     When a non-existent model is specified, the backend should reject
     the request with a validation error.
     """
-    import json
     from unittest.mock import patch, AsyncMock
 
     # Mock the LLM service
@@ -717,6 +637,7 @@ def test_invalid_model_id_returns_error(
 # ============================================================================
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_request_with_sse_accept_header(
     client: TestClient,
     sample_message_minimal: dict
@@ -764,6 +685,7 @@ def test_streaming_request_with_sse_accept_header(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_response_sse_format(
     client: TestClient,
     sample_message_minimal: dict
@@ -779,7 +701,6 @@ def test_streaming_response_sse_format(
     Feature: 009-message-streaming User Story 1
     """
     from unittest.mock import patch
-    import json
 
     # Mock the LLM streaming service
     with patch('src.api.routes.messages.stream_ai_response') as mock_stream_ai:
@@ -819,8 +740,8 @@ def test_streaming_response_sse_format(
 
             # Validate JSON is parseable
             try:
-                event_data = json.loads(json_str)
-            except json.JSONDecodeError as e:
+                event_data = orjson.loads(json_str)
+            except orjson.JSONDecodeError as e:
                 pytest.fail(f"SSE event contains invalid JSON: {e}\nEvent: {json_str}")
 
             # Validate event has type field
@@ -830,6 +751,7 @@ def test_streaming_response_sse_format(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_event_sequence(
     client: TestClient,
     sample_message_minimal: dict
@@ -845,7 +767,6 @@ def test_streaming_event_sequence(
     Feature: 009-message-streaming User Story 1
     """
     from unittest.mock import patch
-    import json
 
     # Mock the LLM streaming service
     with patch('src.api.routes.messages.stream_ai_response') as mock_stream_ai:
@@ -868,13 +789,7 @@ def test_streaming_event_sequence(
         )
 
         # Parse events
-        response_text = response.text
-        events = []
-
-        for event_str in response_text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                json_str = event_str[6:]
-                events.append(json.loads(json_str))
+        events = parse_sse_stream(response)
 
         # Validate event sequence
         assert len(events) >= 2, "Stream must have at least 1 token + 1 complete event"
@@ -894,6 +809,7 @@ def test_streaming_event_sequence(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_backward_compatibility_json_accept(
     client: TestClient,
     sample_message_minimal: dict
@@ -910,7 +826,6 @@ def test_streaming_backward_compatibility_json_accept(
     CRITICAL: This ensures we don't break existing integrations
     """
     from unittest.mock import patch, AsyncMock
-    import json
 
     # Mock the LLM service (non-streaming)
     with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
@@ -946,6 +861,7 @@ def test_streaming_backward_compatibility_json_accept(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_with_conversation_history(
     client: TestClient
 ):
@@ -997,6 +913,7 @@ def test_streaming_with_conversation_history(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_with_custom_model(
     client: TestClient,
     sample_message_minimal: dict
@@ -1010,7 +927,6 @@ def test_streaming_with_custom_model(
     Feature: 009-message-streaming + 008-openai-model-selector
     """
     from unittest.mock import patch
-    import json
 
     # Mock the LLM streaming service
     with patch('src.api.routes.messages.stream_ai_response') as mock_stream_ai:
@@ -1036,10 +952,7 @@ def test_streaming_with_custom_model(
         )
 
         # Parse events
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
+        events = parse_sse_stream(response)
 
         # Find CompleteEvent
         complete_events = [e for e in events if e["type"] == "complete"]
@@ -1051,6 +964,7 @@ def test_streaming_with_custom_model(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_error_event_format(
     client: TestClient,
     sample_message_minimal: dict
@@ -1067,7 +981,6 @@ def test_streaming_error_event_format(
     Feature: 009-message-streaming User Story 3
     """
     from unittest.mock import patch
-    import json
 
     # Mock the LLM streaming service to yield error
     with patch('src.api.routes.messages.stream_ai_response') as mock_stream_ai:
@@ -1086,10 +999,7 @@ def test_streaming_error_event_format(
         )
 
         # Parse events
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
+        events = parse_sse_stream(response)
 
         # Should have exactly one ErrorEvent
         assert len(events) == 1, f"Error stream should have exactly one event, got {len(events)}"
@@ -1106,6 +1016,7 @@ def test_streaming_error_event_format(
 
 
 @pytest.mark.contract
+@pytest.mark.sse
 def test_streaming_sse_headers(
     client: TestClient,
     sample_message_minimal: dict
@@ -10,10 +10,41 @@ Updated for OpenAI LangChain integration.
 
 import pytest
 from unittest.mock import patch, AsyncMock
-from tests.helpers.contract import load_snapshots, replay_snapshot
+from tests.helpers.contract import load_snapshots, replay_all, replay_snapshot
+
+pytestmark = pytest.mark.contract
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize any test requesting 'snapshot' with the frontend snapshots.
+
+    load_snapshots() caches the parsed files, so each process (each worker
+    under xdist) reads the snapshot directory once.
+    """
+    if "snapshot" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "snapshot",
+            load_snapshots(),
+            ids=lambda s: s.metadata.operationId
+        )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_llm_response():
+    """
+    Mock the LLM service once for all snapshot replays in this module.
+
+    Patching per snapshot would repeat the patch setup/teardown for every
+    parametrized case; the mocked response is identical for all of them.
+    """
+    with patch(
+        'src.api.routes.messages.get_ai_response',
+        new=AsyncMock(return_value=("AI response from snapshot replay.", "gpt-3.5-turbo"))
+    ) as mock_get_ai:
+        yield mock_get_ai
 
 
-@pytest.mark.parametrize("snapshot", load_snapshots(), ids=lambda s: s["metadata"]["operationId"])
 def test_backend_handles_frontend_snapshots(client, snapshot):
     """
     Verify backend can handle actual frontend requests.
@@ -26,54 +57,70 @@ def test_backend_handles_frontend_snapshots(client, snapshot):
 
     Updated for OpenAI LangChain integration.
     """
-    operation_id = snapshot["metadata"]["operationId"]
+    operation_id = snapshot.metadata.operationId
 
-    # Mock the LLM service for all snapshot replays
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("AI response from snapshot replay.", "gpt-3.5-turbo")
+    # Replay the snapshot request to the backend
+    response = replay_snapshot(client, snapshot)
 
-        # Replay the snapshot request to the backend
-        response = replay_snapshot(client, snapshot)
+    # Backend must accept the frontend's request format
+    assert response.status_code < 300, (
+        f"Backend rejected snapshot '{operation_id}':\n"
+        f"Status: {response.status_code}\n"
+        f"Response: {response.text}"
+    )
 
-        # Backend must accept the frontend's request format
+    # Response should be valid JSON
+    assert response.headers.get("content-type") == "application/json", (
+        f"Expected JSON response for '{operation_id}', got: {response.headers.get('content-type')}"
+    )
+
+    # Response should have valid structure
+    response_data = response.json()
+    assert isinstance(response_data, dict), f"Response should be an object for '{operation_id}'"
+
+    # Validate response format matches what frontend expects
+    if operation_id == "sendMessage":
+        assert "timestamp" in response_data, "Response must have timestamp field"
+
+        # CRITICAL: Validate timestamp format matches JavaScript's toISOString()
+        # JavaScript produces: "2025-12-29T21:30:45.123Z" (3 decimals - milliseconds)
+        # Python should match this format exactly
+        timestamp = response_data["timestamp"]
+        from datetime import datetime
+        try:
+            # Parse and re-serialize to verify format
+            parsed_date = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            # Check format matches JavaScript's toISOString() - exactly 3 decimal places
+            iso_parts = timestamp.split('.')
+            assert len(iso_parts) == 2, f"Timestamp must have fractional seconds: {timestamp}"
+            fractional = iso_parts[1].rstrip('Z')
+            assert len(fractional) == 3, (
+                f"Timestamp must have exactly 3 decimal places (milliseconds), "
+                f"not {len(fractional)}: {timestamp}"
+            )
+        except Exception as e:
+            raise AssertionError(
+                f"Response timestamp format doesn't match JavaScript's toISOString(): {timestamp}\n"
+                f"Expected format: 2025-12-29T21:30:45.123Z (3 decimals)\n"
+                f"Error: {e}"
+            )
+
+
+@pytest.mark.asyncio
+async def test_backend_handles_all_snapshots_concurrently(app):
+    """
+    Replay every snapshot at once through a shared async client.
+
+    Exercises the backend with the full set of frontend requests in flight
+    together, as the frontend can issue them.
+    """
+    snapshots = load_snapshots()
+    responses = await replay_all(app, snapshots)
+
+    for snapshot, response in zip(snapshots, responses):
+        operation_id = snapshot.metadata.operationId
         assert response.status_code < 300, (
-            f"Backend rejected snapshot '{operation_id}':\n"
+            f"Backend rejected snapshot '{operation_id}' during concurrent replay:\n"
             f"Status: {response.status_code}\n"
             f"Response: {response.text}"
         )
-
-        # Response should be valid JSON
-        assert response.headers.get("content-type") == "application/json", (
-            f"Expected JSON response for '{operation_id}', got: {response.headers.get('content-type')}"
-        )
-
-        # Response should have valid structure
-        response_data = response.json()
-        assert isinstance(response_data, dict), f"Response should be an object for '{operation_id}'"
-
-        # Validate response format matches what frontend expects
-        if operation_id == "sendMessage":
-            assert "timestamp" in response_data, "Response must have timestamp field"
-
-            # CRITICAL: Validate timestamp format matches JavaScript's toISOString()
-            # JavaScript produces: "2025-12-29T21:30:45.123Z" (3 decimals - milliseconds)
-            # Python should match this format exactly
-            timestamp = response_data["timestamp"]
-            from datetime import datetime
-            try:
-                # Parse and re-serialize to verify format
-                parsed_date = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                # Check format matches JavaScript's toISOString() - exactly 3 decimal places
-                iso_parts = timestamp.split('.')
-                assert len(iso_parts) == 2, f"Timestamp must have fractional seconds: {timestamp}"
-                fractional = iso_parts[1].rstrip('Z')
-                assert len(fractional) == 3, (
-                    f"Timestamp must have exactly 3 decimal places (milliseconds), "
-                    f"not {len(fractional)}: {timestamp}"
-                )
-            except Exception as e:
-                raise AssertionError(
-                    f"Response timestamp format doesn't match JavaScript's toISOString(): {timestamp}\n"
-                    f"Expected format: 2025-12-29T21:30:45.123Z (3 decimals)\n"
-                    f"Error: {e}"
-                )
@@ -5,55 +5,111 @@ Utilities for loading frontend contract snapshots and replaying them
 to the backend to verify contract compatibility.
 """
 
-import json
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
 
+# Path to shared snapshot directory (repo-root tests/contract-snapshots)
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent.parent.parent / "tests" / "contract-snapshots"
 
-def load_snapshots() -> List[Dict[str, Any]]:
+
+class SnapshotMetadata(BaseModel):
+    """Capture details recorded by the frontend contract tests."""
+
+    operationId: str
+    capturedAt: str
+    frontendVersion: str
+
+
+class SnapshotRequest(BaseModel):
+    """HTTP request captured from the frontend."""
+
+    method: str
+    path: str
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Optional[Any] = None
+    # Body pre-serialized to JSON bytes at load time (None when there is no body)
+    body_bytes: Optional[bytes] = Field(default=None, exclude=True)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Serialize the body once here so replays can post raw bytes
+        if self.body is not None:
+            self.body_bytes = orjson.dumps(self.body)
+
+            # Raw bytes carry no content type, so make sure one is sent
+            if not any(name.lower() == "content-type" for name in self.headers):
+                self.headers = {**self.headers, "Content-Type": "application/json"}
+
+
+class Snapshot(BaseModel):
+    """A frontend contract snapshot, decoded and validated in one pass."""
+
+    metadata: SnapshotMetadata
+    request: SnapshotRequest
+
+
+def load_snapshots() -> List[Snapshot]:
     """
     Load all contract snapshots from the shared snapshot directory.
 
+    Snapshots are immutable for the duration of a test run, so the parsed
+    result is cached per directory; call _load_snapshots_cached.cache_clear()
+    to force a reload.
+
     Returns:
-        List of snapshot dictionaries, each containing:
-        - metadata: {operationId, capturedAt, frontendVersion}
-        - request: {method, path, headers, body}
+        List of Snapshot models, each containing:
+        - metadata: operationId, capturedAt, frontendVersion
+        - request: method, path, headers, body (and pre-serialized body_bytes)
 
     Raises:
         FileNotFoundError: If snapshot directory doesn't exist
         ValueError: If no snapshots found (frontend tests must run first)
+        pydantic.ValidationError: If a snapshot file is malformed
     """
-    # Path to shared snapshot directory
-    snapshot_dir = Path(__file__).parent.parent.parent.parent / "tests" / "contract-snapshots"
+    return list(_load_snapshots_cached(str(SNAPSHOT_DIR)))
 
-    if not snapshot_dir.exists():
+
+@functools.lru_cache(maxsize=1)
+def _load_snapshots_cached(snapshot_dir: str) -> Tuple[Snapshot, ...]:
+    """Read and parse every snapshot in snapshot_dir (cached, see load_snapshots)."""
+    # One directory scan; DirEntry.is_file() reuses the scandir result
+    try:
+        with os.scandir(snapshot_dir) as entries:
+            snapshot_files = [
+                entry.path for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Snapshot directory not found: {snapshot_dir}\n"
             "Run frontend contract tests first to generate snapshots."
-        )
-
-    # Load all JSON snapshot files
-    snapshots = []
-    for snapshot_file in snapshot_dir.glob("*.json"):
-        if snapshot_file.name == ".gitkeep":
-            continue
+        ) from None
 
-        with open(snapshot_file, 'r') as f:
-            snapshot = json.load(f)
-            snapshots.append(snapshot)
-
-    if not snapshots:
+    if not snapshot_files:
         raise ValueError(
             "No contract snapshots found in tests/contract-snapshots/\n"
             "Run frontend contract tests first: cd frontend && npm test tests/contract/"
         )
 
-    return snapshots
+    # Snapshots are independent, so overlap the file reads across threads
+    with ThreadPoolExecutor(max_workers=min(32, len(snapshot_files))) as executor:
+        return tuple(executor.map(_parse_snapshot, snapshot_files))
+
 
+def _parse_snapshot(snapshot_file: str) -> Snapshot:
+    """Read one snapshot file and decode it straight into a Snapshot model."""
+    with open(snapshot_file, 'rb') as f:
+        return Snapshot.model_validate_json(f.read())
 
-def replay_snapshot(client: TestClient, snapshot: Dict[str, Any]) -> Any:
+
+def replay_snapshot(client: TestClient, snapshot: Snapshot) -> Any:
     """
     Replay a frontend snapshot request to the backend.
 
@@ -63,33 +119,61 @@ def replay_snapshot(client: TestClient, snapshot: Dict[str, Any]) -> Any:
 
     Args:
         client: FastAPI TestClient instance
-        snapshot: Snapshot dictionary from load_snapshots()
+        snapshot: Snapshot from load_snapshots()
 
     Returns:
         Response object from the backend
 
     Example:
-        >>> snapshot = {"request": {"method": "POST", "path": "/api/v1/messages", ...}}
+        >>> snapshot = load_snapshots()[0]
         >>> response = replay_snapshot(client, snapshot)
         >>> assert response.status_code == 200
     """
-    request = snapshot["request"]
+    # Replay the request to the backend
+    return client.request(**_request_kwargs(snapshot))
 
-    # Extract request details
-    method = request["method"]
-    path = request["path"]
-    headers = request.get("headers", {})
-    body = request.get("body")
 
-    # Replay the request to the backend
-    response = client.request(
-        method=method,
-        url=path,
-        headers=headers,
-        json=body if body is not None else None
-    )
+async def replay_all(app: Any, snapshots: List[Snapshot]) -> List[Any]:
+    """
+    Replay a batch of snapshots concurrently against the ASGI app.
+
+    All requests share one httpx.AsyncClient and are dispatched together
+    on a single event loop, instead of one TestClient round-trip each.
+
+    Args:
+        app: ASGI application (e.g. main.app)
+        snapshots: Snapshots from load_snapshots()
+
+    Returns:
+        Responses in the same order as snapshots
+
+    Example:
+        >>> responses = asyncio.run(replay_all(app, load_snapshots()))
+    """
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+        return await asyncio.gather(
+            *(async_client.request(**_request_kwargs(snapshot)) for snapshot in snapshots)
+        )
+
+
+def _request_kwargs(snapshot: Snapshot) -> Dict[str, Any]:
+    """Build httpx request arguments for a snapshot."""
+    request = snapshot.request
+    method, path, headers, body_bytes = request.method, request.path, request.headers, request.body_bytes
+
+    # Bodiless requests (e.g. GET /health) need no content handling at all
+    if body_bytes is None:
+        return {"method": method, "url": path, "headers": headers}
+
+    # Post the pre-serialized body directly, skipping the client's json= encoding
+    return {"method": method, "url": path, "headers": headers, "content": body_bytes}
+
 
-    return response
+# Prefix the loopback endpoint adds to echoed messages
+LOOPBACK_PREFIX = "api says: "
 
 
 def validate_response_schema(response: Any, operation_id: str) -> List[str]:
@@ -122,8 +206,8 @@ def validate_response_schema(response: Any, operation_id: str) -> List[str]:
 
         if "message" not in response_data:
             errors.append("Missing required field: message")
-        elif not response_data["message"].startswith("api says: "):
-            errors.append("Response message must start with 'api says: '")
+        elif not response_data["message"].startswith(LOOPBACK_PREFIX):
+            errors.append(f"Response message must start with '{LOOPBACK_PREFIX}'")
 
         if "timestamp" not in response_data:
             errors.append("Missing required field: timestamp")
@@ -0,0 +1,156 @@
+"""
+Server-Sent Events Helper Functions
+
+Utilities for mocking the event stream behind POST /api/v1/messages and
+parsing the SSE bodies it returns when the client sends
+Accept: text/event-stream.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+import orjson
+
+
+class ListAsyncIterator:
+    """
+    Async iterator over a prebuilt list of events.
+
+    Stands in for the async generator returned by stream_ai_response() when
+    a test only needs a fixed sequence of events, without running an async
+    generator frame per event.
+
+    Example:
+        >>> mock_stream_ai.return_value = ListAsyncIterator([
+        ...     TokenEvent(content="Hi"),
+        ...     CompleteEvent(model="gpt-3.5-turbo"),
+        ... ])
+    """
+
+    def __init__(self, events: Iterable[Any]) -> None:
+        self._events = iter(events)
+
+    def __aiter__(self) -> "ListAsyncIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class SseDecoder:
+    """
+    Incremental SSE decoder.
+
+    Bytes are fed in arbitrary chunks; each complete event (terminated by a
+    blank line) is decoded as soon as it arrives and dropped from the buffer,
+    so only the unfinished tail of the stream is ever held. CRLF and bare CR
+    line endings are normalized to LF as they are fed.
+
+    Example:
+        >>> decoder = SseDecoder()
+        >>> decoder.feed(b'data: {"type": "tok')
+        []
+        >>> decoder.feed(b'en"}\\n\\n')
+        [{'type': 'token'}]
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # A CR at the end of a chunk may be the first half of a CRLF
+        self._pending_cr = False
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """
+        Add a chunk of the stream and return the events it completes.
+
+        Args:
+            chunk: Next bytes of the SSE body
+
+        Returns:
+            Decoded JSON payloads of the events completed by this chunk
+        """
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+        self._pending_cr = chunk.endswith(b"\r")
+        if self._pending_cr:
+            chunk = chunk[:-1]
+        self._buffer.extend(chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+
+        events = []
+        while (end := self._buffer.find(b"\n\n")) != -1:
+            event = _decode_event(bytes(self._buffer[:end]))
+            del self._buffer[:end + 2]
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Decode whatever remains once the stream has ended.
+
+        Returns:
+            The final event if the stream ended without a trailing blank line
+        """
+        event = _decode_event(bytes(self._buffer))
+        self._buffer.clear()
+        self._pending_cr = False
+        return [event] if event is not None else []
+
+
+def _decode_event(block: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Decode one SSE event block.
+
+    The ``data:`` lines are joined and decoded as JSON; other SSE fields
+    (event, id, retry) and comments are ignored.
+
+    Returns:
+        Decoded payload, or None if the block carries no data
+    """
+    data_lines = []
+    for line in block.split(b"\n"):
+        field, _, value = line.partition(b":")
+        if field == b"data":
+            data_lines.append(value.lstrip())
+    if not data_lines:
+        return None
+    return orjson.loads(b"\n".join(data_lines))
+
+
+def parse_sse_stream(response: httpx.Response) -> List[Dict[str, Any]]:
+    """
+    Parse every SSE event in a response, chunk by chunk.
+
+    Args:
+        response: Response from the streaming endpoint
+
+    Returns:
+        List of decoded event payloads in stream order
+    """
+    decoder = SseDecoder()
+    events = []
+    for chunk in response.iter_bytes():
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return events
+
+
+async def aparse_sse_stream(response: httpx.Response) -> List[Dict[str, Any]]:
+    """
+    Async counterpart of parse_sse_stream for httpx.AsyncClient responses.
+
+    Args:
+        response: Response from the streaming endpoint
+
+    Returns:
+        List of decoded event payloads in stream order
+    """
+    decoder = SseDecoder()
+    events = []
+    async for chunk in response.aiter_bytes():
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return events
@@ -0,0 +1,83 @@
+"""
+Shared fixtures for integration tests.
+
+The environment (OPENAI_API_KEY, MODELS) is already provided per test by the
+autouse mock_test_env_vars fixture in tests/conftest.py.
+"""
+
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+# Import the patch targets up front so LangChain's import cost is paid once at
+# collection, not inside whichever test first enters patch(...)
+import src.services.llm_service  # noqa: F401
+import src.services.providers.openai  # noqa: F401
+from src.config.models import ModelConfig, ModelsConfiguration
+
+
+@pytest.fixture(scope="module")
+def gpt35_config() -> ModelsConfiguration:
+    """
+    Single-model OpenAI configuration with gpt-3.5-turbo as the default.
+
+    Module-scoped: the configuration is only read by the code under test,
+    so one validated instance is shared across a module's tests.
+    """
+    return ModelsConfiguration(models=[
+        ModelConfig(
+            id="gpt-3.5-turbo",
+            name="GPT-3.5 Turbo",
+            description="Fast and efficient",
+            provider="openai",
+            default=True
+        )
+    ])
+
+
+@pytest.fixture
+def mock_chat_openai(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """
+    Replace the ChatOpenAI class used by the OpenAI provider.
+
+    The mock is installed with monkeypatch, which undoes it at teardown.
+    Its return_value is the LLM instance that provider.create_llm() returns,
+    and ainvoke on that instance is already an AsyncMock.
+
+    Returns:
+        Mock standing in for the ChatOpenAI class
+    """
+    mock_chat = Mock()
+    mock_chat.return_value.ainvoke = AsyncMock()
+    monkeypatch.setattr('src.services.providers.openai.ChatOpenAI', mock_chat)
+    return mock_chat
+
+
+@pytest.fixture
+def mock_llm(mock_chat_openai: Mock) -> Mock:
+    """
+    LLM instance returned by the patched ChatOpenAI, with an async ainvoke.
+
+    Tests only need to set the reply, e.g.
+    ``mock_llm.ainvoke.return_value = SimpleNamespace(content="...")``.
+    """
+    return mock_chat_openai.return_value
+
+
+@pytest.fixture
+async def async_client(app) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    httpx.AsyncClient bound directly to the ASGI app.
+
+    Requests run on the test's own event loop rather than through
+    TestClient's thread portal, so mocked async generators are consumed on
+    the loop that created them and requests can be issued concurrently.
+
+    Yields:
+        AsyncClient with base_url http://testserver
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
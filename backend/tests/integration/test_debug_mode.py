@@ -4,74 +4,75 @@ Integration tests for DEBUG mode error handling.
 Verifies that when DEBUG=true, detailed error information is exposed in API responses.
 """
 
-import os
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch
 
-from main import app
+
+def reconfigure(monkeypatch, *, debug: bool, models: str) -> None:
+    """
+    Point the running app at a new DEBUG flag and MODELS value.
+
+    The routes read DEBUG and MODELS from the environment on every request,
+    so overriding just these two variables reconfigures the shared session
+    client without rebuilding the app. The autouse mock_test_env_vars
+    fixture already sets OPENAI_API_KEY (so the OpenAI provider is enabled
+    and invalid MODELS JSON triggers an error) and clears ANTHROPIC_API_KEY.
+
+    Args:
+        monkeypatch: pytest fixture, restores the environment after the test
+        debug: Value for the DEBUG flag
+        models: Raw MODELS environment variable value
+    """
+    monkeypatch.setenv("DEBUG", "true" if debug else "false")
+    monkeypatch.setenv("MODELS", models)
 
 
 @pytest.mark.integration
-def test_debug_mode_model_configuration_error():
+def test_debug_mode_model_configuration_error(client: TestClient, monkeypatch):
     """
     Verify that model configuration errors include debug info when DEBUG=true.
     """
     # Enable DEBUG mode with invalid configuration
-    # Use clear=True to avoid inheriting environment configs that may conflict
-    # Must include OPENAI_API_KEY to enable the OpenAI provider (so invalid JSON triggers error)
-    with patch.dict(os.environ, {
-        "DEBUG": "true",
-        "OPENAI_API_KEY": "test-key",
-        "MODELS": "invalid json"
-    }, clear=True):
-        client = TestClient(app)
+    reconfigure(monkeypatch, debug=True, models="invalid json")
 
-        # Request models endpoint
-        response = client.get("/api/v1/models")
+    # Request models endpoint
+    response = client.get("/api/v1/models")
 
-        # Should return 503
-        assert response.status_code == 503
+    # Should return 503
+    assert response.status_code == 503
 
-        data = response.json()
+    data = response.json()
 
-        # HTTPException puts everything under 'detail'
-        assert "detail" in data
-        detail = data["detail"]
+    # HTTPException puts everything under 'detail'
+    assert "detail" in data
+    detail = data["detail"]
 
-        # Should include debug_info
-        assert "debug_info" in detail
-        assert detail["debug_info"]["error_type"] == "ModelConfigurationError"
-        assert "traceback" in detail["debug_info"]
-        assert "Invalid JSON" in detail["debug_info"]["error_message"]
+    # Should include debug_info
+    assert "debug_info" in detail
+    assert detail["debug_info"]["error_type"] == "ModelConfigurationError"
+    assert "traceback" in detail["debug_info"]
+    assert "Invalid JSON" in detail["debug_info"]["error_message"]
 
 
 @pytest.mark.integration
-def test_debug_mode_disabled_hides_details():
+def test_debug_mode_disabled_hides_details(client: TestClient, monkeypatch):
     """
     Verify that when DEBUG=false, detailed error information is NOT exposed.
     """
     # Disable DEBUG mode with invalid configuration
-    # Use clear=True to avoid inheriting environment configs that may conflict
-    # Must include OPENAI_API_KEY to enable the OpenAI provider (so invalid JSON triggers error)
-    with patch.dict(os.environ, {
-        "DEBUG": "false",
-        "OPENAI_API_KEY": "test-key",
-        "MODELS": "invalid json"
-    }, clear=True):
-        client = TestClient(app)
+    reconfigure(monkeypatch, debug=False, models="invalid json")
 
-        # Request models endpoint
-        response = client.get("/api/v1/models")
+    # Request models endpoint
+    response = client.get("/api/v1/models")
 
-        # Should return 503
-        assert response.status_code == 503
+    # Should return 503
+    assert response.status_code == 503
 
-        data = response.json()
+    data = response.json()
 
-        # HTTPException puts everything under 'detail'
-        assert "detail" in data
-        detail = data["detail"]
+    # HTTPException puts everything under 'detail'
+    assert "detail" in data
+    detail = data["detail"]
 
-        # Should NOT include debug_info when DEBUG is false
-        assert "debug_info" not in detail
+    # Should NOT include debug_info when DEBUG is false
+    assert "debug_info" not in detail
@@ -1,7 +1,8 @@
 """
 Integration Tests for Error Handling
 
-Tests error scenarios and validation for the message API.
+Tests error scenarios and validation for the message API, including
+sanitization of LLM errors returned over HTTP.
 Tests acceptance criteria from User Story 2.
 
 Feature: 003-backend-api-loopback User Story 2
@@ -9,21 +10,47 @@ Tests: T052-T054 (error handling validation)
 Updated for OpenAI LangChain integration.
 """
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock
+
+from src.services.llm_service import (
+    LLMAuthenticationError,
+    LLMRateLimitError,
+    LLMConnectionError
+)
+
+# Boundary payloads for the 10,000 character limit, built once per module
+MAX_LENGTH_MESSAGE = "a" * 10000
+TOO_LONG_MESSAGE = MAX_LENGTH_MESSAGE + "a"
+MAX_LENGTH_BODY = orjson.dumps({"message": MAX_LENGTH_MESSAGE})
+TOO_LONG_BODY = orjson.dumps({"message": TOO_LONG_MESSAGE})
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Substrings that must never reach the client in an error message (matched
+# against the lowercased message): API keys, org IDs, raw URLs, raw exceptions
+SENSITIVE_SUBSTRINGS = ("sk-", "org-", "https://", "exception")
+# At least one of these should appear in a user-facing error message
+USER_FRIENDLY_WORDS = ("service", "unavailable", "error", "busy", "configuration", "timeout")
 
 
 @pytest.mark.integration
-def test_empty_message_rejected_by_backend(client: TestClient):
+@pytest.mark.validation
+@pytest.mark.parametrize(
+    "message",
+    ["", "   ", "\n\n\n", "\t\t\t"],
+    ids=["empty", "spaces", "newlines", "tabs"]
+)
+def test_blank_message_rejected(client: TestClient, message: str):
     """
-    T052: Empty message returns 422 error (Pydantic validation).
+    T052: Empty or whitespace-only message returns 422 error (Pydantic validation).
 
     Validates FR-012: Backend validates and rejects malformed requests.
 
     Expected: 422 Unprocessable Entity with error message
     """
-    response = client.post("/api/v1/messages", json={"message": ""})
+    response = client.post("/api/v1/messages", json={"message": message})
 
     assert response.status_code == 422
     data = response.json()
@@ -34,35 +61,14 @@ def test_empty_message_rejected_by_backend(client: TestClient):
 
 
 @pytest.mark.integration
-def test_whitespace_only_message_rejected(client: TestClient):
-    """
-    Test whitespace-only message returns 422 error (Pydantic validation).
-
-    Validates FR-012: Backend validates and rejects malformed requests.
-    """
-    # Test with spaces
-    response = client.post("/api/v1/messages", json={"message": "   "})
-    assert response.status_code == 422
-
-    # Test with newlines
-    response = client.post("/api/v1/messages", json={"message": "\n\n\n"})
-    assert response.status_code == 422
-
-    # Test with tabs
-    response = client.post("/api/v1/messages", json={"message": "\t\t\t"})
-    assert response.status_code == 422
-
-
-@pytest.mark.integration
+@pytest.mark.validation
 def test_too_long_message_rejected(client: TestClient):
     """
     T053: Message exceeding 10,000 characters returns 422 error (Pydantic validation).
 
     Validates FR-007: Reject messages > 10,000 chars.
     """
-    long_message = "a" * 10001
-
-    response = client.post("/api/v1/messages", json={"message": long_message})
+    response = client.post("/api/v1/messages", content=TOO_LONG_BODY, headers=JSON_HEADERS)
 
     assert response.status_code == 422
     data = response.json()
@@ -73,6 +79,7 @@ def test_too_long_message_rejected(client: TestClient):
 
 
 @pytest.mark.integration
+@pytest.mark.validation
 def test_malformed_json_rejected(client: TestClient):
     """
     T054: Malformed JSON returns 422 error.
@@ -90,6 +97,7 @@ def test_malformed_json_rejected(client: TestClient):
 
 
 @pytest.mark.integration
+@pytest.mark.validation
 def test_missing_message_field_rejected(client: TestClient):
     """
     Test missing required 'message' field returns 422 error.
@@ -106,6 +114,7 @@ def test_missing_message_field_rejected(client: TestClient):
 
 
 @pytest.mark.integration
+@pytest.mark.validation
 def test_invalid_conversation_id_format(client: TestClient):
     """
     Test invalid UUID format for conversationId.
@@ -149,7 +158,8 @@ def test_error_response_structure(client: TestClient):
 
 
 @pytest.mark.integration
-def test_exactly_10000_chars_accepted(client: TestClient):
+@pytest.mark.validation
+def test_exactly_10000_chars_accepted(client: TestClient, mock_get_ai: AsyncMock):
     """
     Test that exactly 10,000 characters is accepted (boundary test).
 
@@ -157,15 +167,69 @@ def test_exactly_10000_chars_accepted(client: TestClient):
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("AI response to 10,000 character message.", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("AI response to 10,000 character message.", "gpt-3.5-turbo")
+
+    response = client.post("/api/v1/messages", content=MAX_LENGTH_BODY, headers=JSON_HEADERS)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    assert len(data["message"]) > 0, "Response message cannot be empty"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error_exception,description", [
+    (LLMAuthenticationError("AI service configuration error"),
+     "authentication error should be sanitized"),
+    (LLMRateLimitError("AI service is busy"),
+     "rate limit error should be sanitized"),
+    (LLMConnectionError("Unable to reach AI service"),
+     "connection error should be sanitized"),
+], ids=["authentication", "rate_limit", "connection"])
+async def test_no_sensitive_data_in_error_responses(
+    client: TestClient,
+    mock_get_ai: AsyncMock,
+    error_exception: Exception,
+    description: str
+):
+    """
+    T033: Integration test verifying no sensitive data in error responses.
+
+    Validates that LLM errors are sanitized and don't expose:
+    - API keys
+    - Raw exception messages
+    - Stack traces
+    - Internal implementation details
+
+    Feature: 006-openai-langchain-chat User Story 3
+    """
+    # Mock get_ai_response to raise the error
+    mock_get_ai.side_effect = error_exception
+
+    # Make request
+    response = client.post(
+        "/api/v1/messages",
+        json={"message": "Test message"}
+    )
+
+    # Verify error response exists
+    assert response.status_code in [400, 503, 504], \
+        f"Expected error status code, got {response.status_code}"
+
+    data = response.json()
+    # Error fields should be at top level, not wrapped in "detail"
+    assert "error" in data, f"Error response must include 'error' field at top level. Got: {data}"
+    assert "status" in data, f"Error response must include 'status' field. Got: {data}"
+    assert data["status"] == "error", f"Status should be 'error'. Got: {data['status']}"
 
-        message = "a" * 10000
+    error_msg = data["error"].lower()
 
-        response = client.post("/api/v1/messages", json={"message": message})
+    # CRITICAL: Must NOT expose API keys, org IDs, raw URLs or raw exceptions
+    leaked = [token for token in SENSITIVE_SUBSTRINGS if token in error_msg]
+    assert not leaked, \
+        f"Error must not expose {leaked}: {description}"
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert len(data["message"]) > 0, "Response message cannot be empty"
+    # Verify message is user-friendly (not technical)
+    assert any(word in error_msg for word in USER_FRIENDLY_WORDS), \
+        f"Error message should be user-friendly: {data['error']}"
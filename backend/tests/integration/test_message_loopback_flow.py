@@ -11,13 +11,14 @@ Tests: T023-T026 (Updated for OpenAI LangChain integration)
 import time
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock
 
 
 @pytest.mark.integration
 def test_send_message_receives_loopback_response(
     client: TestClient,
-    sample_message_request: dict
+    sample_message_request: dict,
+    mock_get_ai: AsyncMock
 ):
     """
     T023: POST /api/v1/messages returns AI response.
@@ -29,26 +30,25 @@ def test_send_message_receives_loopback_response(
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("This is an AI response.", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("This is an AI response.", "gpt-3.5-turbo")
 
-        # Send message
-        response = client.post("/api/v1/messages", json=sample_message_request)
+    # Send message
+    response = client.post("/api/v1/messages", json=sample_message_request)
 
-        # Assert response
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    # Assert response
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-        data = response.json()
-        assert data["status"] == "success"
-        assert len(data["message"]) > 0, "Response message cannot be empty"
-        assert "timestamp" in data
+    data = response.json()
+    assert data["status"] == "success"
+    assert len(data["message"]) > 0, "Response message cannot be empty"
+    assert "timestamp" in data
 
 
 @pytest.mark.integration
 def test_loopback_preserves_special_characters(
     client: TestClient,
-    sample_message_special_chars: dict
+    sample_message_special_chars: dict,
+    mock_get_ai: AsyncMock
 ):
     """
     T024: Special characters, emoji, and newlines are handled by AI endpoint.
@@ -61,25 +61,24 @@ def test_loopback_preserves_special_characters(
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service to handle special characters
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("AI response with special chars: 🚀 世界", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("AI response with special chars: 🚀 世界", "gpt-3.5-turbo")
 
-        # Send message with special characters
-        response = client.post("/api/v1/messages", json=sample_message_special_chars)
+    # Send message with special characters
+    response = client.post("/api/v1/messages", json=sample_message_special_chars)
 
-        # Assert response
-        assert response.status_code == 200
+    # Assert response
+    assert response.status_code == 200
 
-        data = response.json()
-        assert data["status"] == "success"
-        assert len(data["message"]) > 0, "Response message cannot be empty"
+    data = response.json()
+    assert data["status"] == "success"
+    assert len(data["message"]) > 0, "Response message cannot be empty"
 
 
 @pytest.mark.integration
 def test_loopback_response_time_under_2_seconds(
     client: TestClient,
-    sample_message_minimal: dict
+    sample_message_minimal: dict,
+    mock_get_ai: AsyncMock
 ):
     """
     T025: Response received within 2 seconds.
@@ -91,26 +90,24 @@ def test_loopback_response_time_under_2_seconds(
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service for fast response
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("Quick AI response.", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("Quick AI response.", "gpt-3.5-turbo")
 
-        # Measure response time
-        start_time = time.time()
-        response = client.post("/api/v1/messages", json=sample_message_minimal)
-        duration = time.time() - start_time
+    # Measure response time with the monotonic high-resolution clock
+    start_ns = time.perf_counter_ns()
+    response = client.post("/api/v1/messages", json=sample_message_minimal)
+    duration_ns = time.perf_counter_ns() - start_ns
 
-        # Assert response time
-        assert duration < 2.0, f"Response took {duration:.2f}s (expected < 2s)"
+    # Assert response time
+    assert duration_ns < 2_000_000_000, f"Response took {duration_ns / 1e9:.2f}s (expected < 2s)"
 
-        # Assert successful response
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
+    # Assert successful response
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
 
 
 @pytest.mark.integration
-def test_multiple_messages_in_sequence(client: TestClient):
+def test_multiple_messages_in_sequence(client: TestClient, mock_get_ai: AsyncMock):
     """
     T026: Multiple messages in sequence each receive AI responses.
 
@@ -122,75 +119,69 @@ def test_multiple_messages_in_sequence(client: TestClient):
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        messages = [
-            "First message",
-            "Second message",
-            "Third message with emoji 🚀",
-            "Fourth message\nwith newline"
-        ]
+    messages = [
+        "First message",
+        "Second message",
+        "Third message with emoji 🚀",
+        "Fourth message\nwith newline"
+    ]
 
-        for i, msg in enumerate(messages):
-            # Set different AI response for each message
-            mock_get_ai.return_value = (f"AI response #{i+1}", "gpt-3.5-turbo")
+    for i, msg in enumerate(messages):
+        # Set different AI response for each message
+        mock_get_ai.return_value = (f"AI response #{i+1}", "gpt-3.5-turbo")
 
-            # Send message
-            response = client.post("/api/v1/messages", json={"message": msg})
+        # Send message
+        response = client.post("/api/v1/messages", json={"message": msg})
 
-            # Assert response
-            assert response.status_code == 200, f"Failed on message: {msg}"
+        # Assert response
+        assert response.status_code == 200, f"Failed on message: {msg}"
 
-            data = response.json()
-            assert data["status"] == "success"
-            assert len(data["message"]) > 0, f"Empty response for message: {msg}"
+        data = response.json()
+        assert data["status"] == "success"
+        assert len(data["message"]) > 0, f"Empty response for message: {msg}"
 
 
 @pytest.mark.integration
-def test_minimal_message_request(client: TestClient):
+def test_minimal_message_request(client: TestClient, mock_get_ai: AsyncMock):
     """
     Test minimal request with only required fields.
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("AI response to minimal request.", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("AI response to minimal request.", "gpt-3.5-turbo")
 
-        response = client.post("/api/v1/messages", json={"message": "Test"})
+    response = client.post("/api/v1/messages", json={"message": "Test"})
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert len(data["message"]) > 0, "Response message cannot be empty"
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    assert len(data["message"]) > 0, "Response message cannot be empty"
 
 
 @pytest.mark.integration
-def test_message_with_conversation_id(client: TestClient):
+def test_message_with_conversation_id(client: TestClient, mock_get_ai: AsyncMock):
     """
     Test request with optional conversationId field.
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("AI response with conversation context.", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("AI response with conversation context.", "gpt-3.5-turbo")
 
-        request_data = {
-            "message": "Test with conversation ID",
-            "conversationId": "conv-a1b2c3d4-5678-90ab-cdef-123456789abc"
-        }
+    request_data = {
+        "message": "Test with conversation ID",
+        "conversationId": "conv-a1b2c3d4-5678-90ab-cdef-123456789abc"
+    }
 
-        response = client.post("/api/v1/messages", json=request_data)
+    response = client.post("/api/v1/messages", json=request_data)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert len(data["message"]) > 0, "Response message cannot be empty"
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    assert len(data["message"]) > 0, "Response message cannot be empty"
 
 
 @pytest.mark.integration
-def test_multiline_message_preserved(client: TestClient):
+def test_multiline_message_preserved(client: TestClient, mock_get_ai: AsyncMock):
     """
     Test that multiline messages are handled by AI endpoint.
 
@@ -198,14 +189,12 @@ def test_multiline_message_preserved(client: TestClient):
 
     Updated for OpenAI LangChain integration.
     """
-    # Mock the LLM service
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        mock_get_ai.return_value = ("AI response to multiline message.", "gpt-3.5-turbo")
+    mock_get_ai.return_value = ("AI response to multiline message.", "gpt-3.5-turbo")
 
-        multiline_message = "Line 1\nLine 2\nLine 3\n\nLine 5 after blank"
+    multiline_message = "Line 1\nLine 2\nLine 3\n\nLine 5 after blank"
 
-        response = client.post("/api/v1/messages", json={"message": multiline_message})
+    response = client.post("/api/v1/messages", json={"message": multiline_message})
 
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["message"]) > 0, "Response message cannot be empty"
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["message"]) > 0, "Response message cannot be empty"
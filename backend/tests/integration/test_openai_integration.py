@@ -9,13 +9,23 @@ Updated for: 011-anthropic-support multi-provider architecture
 Tests: T005 (Updated for multi-provider)
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-from fastapi.testclient import TestClient
+from unittest.mock import Mock
+
+from src.config.models import ModelsConfiguration, load_model_configuration
+from src.services.llm_service import (
+    LLMAuthenticationError,
+    convert_to_langchain_messages,
+    get_ai_response,
+    get_llm_for_model
+)
 
 
 @pytest.mark.integration
-def test_llm_service_provider_routing_openai():
+@pytest.mark.openai_mock
+def test_llm_service_provider_routing_openai(mock_chat_openai: Mock, gpt35_config: ModelsConfiguration):
     """
     T005 (Updated): Integration test for LLM service provider routing.
 
@@ -24,38 +34,18 @@ def test_llm_service_provider_routing_openai():
 
     Updated for 011-anthropic-support multi-provider architecture.
     """
-    from src.services.llm_service import get_llm_for_model
-    from src.config.models import ModelsConfiguration, ModelConfig
-
-    with patch.dict('os.environ', {
-        'OPENAI_API_KEY': 'test-integration-key',
-    }):
-        with patch('src.services.providers.openai.ChatOpenAI') as mock_chat:
-            mock_instance = Mock()
-            mock_chat.return_value = mock_instance
-
-            # Create mock config
-            config = ModelsConfiguration(models=[
-                ModelConfig(
-                    id="gpt-3.5-turbo",
-                    name="GPT-3.5 Turbo",
-                    description="Fast and efficient",
-                    provider="openai",
-                    default=True
-                )
-            ])
-
-            # Get LLM instance for OpenAI model
-            llm = get_llm_for_model("gpt-3.5-turbo", config)
-
-            # Verify initialization
-            assert llm is not None
-            mock_chat.assert_called_once()
+    # Get LLM instance for OpenAI model
+    llm = get_llm_for_model("gpt-3.5-turbo", gpt35_config)
+
+    # Verify initialization
+    assert llm is not None
+    mock_chat_openai.assert_called_once()
 
 
 @pytest.mark.integration
+@pytest.mark.openai_mock
 @pytest.mark.asyncio
-async def test_openai_api_response_mocking():
+async def test_openai_api_response_mocking(mock_llm: Mock, gpt35_config: ModelsConfiguration):
     """
     T005 (Updated): Integration test with mocked OpenAI API response.
 
@@ -64,40 +54,16 @@ async def test_openai_api_response_mocking():
 
     Updated for 011-anthropic-support multi-provider architecture.
     """
-    from src.services.llm_service import get_llm_for_model
-    from src.config.models import ModelsConfiguration, ModelConfig
-
-    with patch.dict('os.environ', {
-        'OPENAI_API_KEY': 'test-key',
-    }):
-        with patch('src.services.providers.openai.ChatOpenAI') as mock_chat:
-            # Create mock LLM instance with async ainvoke
-            mock_llm = Mock()
-            mock_chat.return_value = mock_llm
-
-            # Mock the ainvoke method to return a response
-            mock_response = Mock()
-            mock_response.content = "Hello! I'm doing well, thank you for asking."
-            mock_llm.ainvoke = AsyncMock(return_value=mock_response)
-
-            # Create mock config
-            config = ModelsConfiguration(models=[
-                ModelConfig(
-                    id="gpt-3.5-turbo",
-                    name="GPT-3.5 Turbo",
-                    description="Fast and efficient",
-                    provider="openai",
-                    default=True
-                )
-            ])
-
-            # Get LLM instance and invoke
-            llm = get_llm_for_model("gpt-3.5-turbo", config)
-            result = await llm.ainvoke("Hello, how are you?")
-
-            # Verify response
-            assert result.content == "Hello! I'm doing well, thank you for asking."
-            mock_llm.ainvoke.assert_called_once()
+    # Mock the ainvoke method to return a response
+    mock_llm.ainvoke.return_value = SimpleNamespace(content="Hello! I'm doing well, thank you for asking.")
+
+    # Get LLM instance and invoke
+    llm = get_llm_for_model("gpt-3.5-turbo", gpt35_config)
+    result = await llm.ainvoke("Hello, how are you?")
+
+    # Verify response
+    assert result.content == "Hello! I'm doing well, thank you for asking."
+    mock_llm.ainvoke.assert_called_once()
 
 
 @pytest.mark.integration
@@ -111,8 +77,6 @@ async def test_llm_service_handles_message_conversion():
 
     Updated for T022: Now accepts message history array format.
     """
-    from src.services.llm_service import convert_to_langchain_messages
-
     # Test simple message conversion (single message as history array)
     message_history = [{"sender": "user", "text": "Hello, how are you?"}]
     langchain_messages = convert_to_langchain_messages(message_history)
@@ -123,7 +87,7 @@ async def test_llm_service_handles_message_conversion():
 
 
 @pytest.mark.integration
-def test_model_config_loaded_from_environment():
+def test_model_config_loaded_from_environment(monkeypatch):
     """
     T005 (Updated): Integration test for environment-based configuration.
 
@@ -132,21 +96,21 @@ def test_model_config_loaded_from_environment():
 
     Updated for 011-anthropic-support multi-provider architecture.
     """
-    from src.config.models import load_model_configuration
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-integration-test-key-12345')
+    monkeypatch.setenv(
+        'MODELS',
+        '[{"id": "gpt-4", "name": "GPT-4", "description": "Most capable", "provider": "openai", "default": true}]'
+    )
 
-    with patch.dict('os.environ', {
-        'OPENAI_API_KEY': 'sk-integration-test-key-12345',
-        'MODELS': '[{"id": "gpt-4", "name": "GPT-4", "description": "Most capable", "provider": "openai", "default": true}]'
-    }, clear=True):
-        config = load_model_configuration()
+    config = load_model_configuration()
 
-        assert len(config.models) == 1
-        assert config.models[0].id == 'gpt-4'
-        assert config.models[0].provider == 'openai'
+    assert len(config.models) == 1
+    assert config.models[0].id == 'gpt-4'
+    assert config.models[0].provider == 'openai'
 
 
 @pytest.mark.integration
-def test_llm_service_error_on_missing_api_key():
+def test_llm_service_error_on_missing_api_key(monkeypatch, gpt35_config: ModelsConfiguration):
     """
     T005 (Updated): Integration test for missing API key error handling.
 
@@ -155,28 +119,17 @@ def test_llm_service_error_on_missing_api_key():
 
     Updated for 011-anthropic-support multi-provider architecture.
     """
-    from src.services.llm_service import get_llm_for_model, LLMAuthenticationError
-    from src.config.models import ModelsConfiguration, ModelConfig
-
     # Test missing OpenAI API key
-    with patch.dict('os.environ', {}, clear=True):
-        config = ModelsConfiguration(models=[
-            ModelConfig(
-                id="gpt-3.5-turbo",
-                name="GPT-3.5 Turbo",
-                description="Fast and efficient",
-                provider="openai",
-                default=True
-            )
-        ])
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
 
-        with pytest.raises(LLMAuthenticationError, match="OpenAI API key not configured"):
-            get_llm_for_model("gpt-3.5-turbo", config)
+    with pytest.raises(LLMAuthenticationError, match="OpenAI API key not configured"):
+        get_llm_for_model("gpt-3.5-turbo", gpt35_config)
 
 
 @pytest.mark.integration
+@pytest.mark.openai_mock
 @pytest.mark.asyncio
-async def test_llm_response_preserves_special_characters():
+async def test_llm_response_preserves_special_characters(mock_llm: Mock, gpt35_config: ModelsConfiguration):
     """
     T005: Integration test verifying special character handling.
 
@@ -185,45 +138,22 @@ async def test_llm_response_preserves_special_characters():
 
     Updated for 011-anthropic-support multi-provider architecture.
     """
-    from src.services.llm_service import get_llm_for_model
-    from src.config.models import ModelsConfiguration, ModelConfig
-
-    with patch.dict('os.environ', {
-        'OPENAI_API_KEY': 'test-key',
-    }):
-        with patch('src.services.providers.openai.ChatOpenAI') as mock_chat:
-            # Setup mock
-            mock_llm = Mock()
-            mock_chat.return_value = mock_llm
-
-            # Mock response with special characters
-            mock_response = Mock()
-            mock_response.content = "🚀 means rocket! Unicode: 世界"
-            mock_llm.ainvoke = AsyncMock(return_value=mock_response)
-
-            # Create mock config
-            config = ModelsConfiguration(models=[
-                ModelConfig(
-                    id="gpt-3.5-turbo",
-                    name="GPT-3.5 Turbo",
-                    description="Fast and efficient",
-                    provider="openai",
-                    default=True
-                )
-            ])
-
-            # Invoke with special characters
-            llm = get_llm_for_model("gpt-3.5-turbo", config)
-            result = await llm.ainvoke("What does 🚀 mean?")
-
-            # Verify special characters preserved
-            assert "🚀" in result.content
-            assert "世界" in result.content
+    # Mock response with special characters
+    mock_llm.ainvoke.return_value = SimpleNamespace(content="🚀 means rocket! Unicode: 世界")
+
+    # Invoke with special characters
+    llm = get_llm_for_model("gpt-3.5-turbo", gpt35_config)
+    result = await llm.ainvoke("What does 🚀 mean?")
+
+    # Verify special characters preserved
+    assert "🚀" in result.content
+    assert "世界" in result.content
 
 
 @pytest.mark.integration
+@pytest.mark.openai_mock
 @pytest.mark.asyncio
-async def test_single_message_ai_response_flow():
+async def test_single_message_ai_response_flow(mock_llm: Mock):
     """
     T011: Integration test for complete AI response flow.
 
@@ -236,110 +166,19 @@ async def test_single_message_ai_response_flow():
     Feature: 006-openai-langchain-chat User Story 1
     Updated for 011-anthropic-support multi-provider architecture.
     """
-    from src.services.llm_service import get_ai_response
-
-    with patch.dict('os.environ', {
-        'OPENAI_API_KEY': 'test-integration-key',
-        'MODELS': '[{"id": "gpt-3.5-turbo", "name": "GPT-3.5 Turbo", "description": "Fast and efficient", "provider": "openai", "default": true}]'
-    }, clear=True):
-        with patch('src.services.providers.openai.ChatOpenAI') as mock_chat:
-            # Setup mock LLM with realistic AI response
-            mock_llm = Mock()
-            mock_chat.return_value = mock_llm
+    # Mock realistic AI response
+    mock_llm.ainvoke.return_value = SimpleNamespace(content="Hello! I'm an AI assistant. How can I help you today?")
 
-            # Mock realistic AI response
-            mock_response = Mock()
-            mock_response.content = "Hello! I'm an AI assistant. How can I help you today?"
-            mock_llm.ainvoke = AsyncMock(return_value=mock_response)
+    # Process message through AI service
+    user_message = "Hello, how are you?"
+    ai_response, model_used = await get_ai_response(user_message)
 
-            # Process message through AI service
-            user_message = "Hello, how are you?"
-            ai_response, model_used = await get_ai_response(user_message)
+    # Verify AI response
+    assert ai_response == "Hello! I'm an AI assistant. How can I help you today?"
+    assert not ai_response.startswith("api says: "), \
+        "AI response should not have loopback prefix"
+    assert model_used  # Verify model is returned
 
-            # Verify AI response
-            assert ai_response == "Hello! I'm an AI assistant. How can I help you today?"
-            assert not ai_response.startswith("api says: "), \
-                "AI response should not have loopback prefix"
-            assert model_used  # Verify model is returned
-
-            # Verify LLM was invoked
-            mock_llm.ainvoke.assert_called_once()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_no_sensitive_data_in_error_responses():
-    """
-    T033: Integration test verifying no sensitive data in error responses.
-
-    Validates that LLM errors are sanitized and don't expose:
-    - API keys
-    - Raw exception messages
-    - Stack traces
-    - Internal implementation details
-
-    Feature: 006-openai-langchain-chat User Story 3
-    """
-    from fastapi.testclient import TestClient
-    from main import app
-    from src.services.llm_service import (
-        LLMAuthenticationError,
-        LLMRateLimitError,
-        LLMConnectionError
-    )
+    # Verify LLM was invoked
+    mock_llm.ainvoke.assert_called_once()
 
-    client = TestClient(app)
-
-    # Test scenarios that should NOT expose sensitive data
-    error_scenarios = [
-        (LLMAuthenticationError("AI service configuration error"),
-         "authentication error should be sanitized"),
-        (LLMRateLimitError("AI service is busy"),
-         "rate limit error should be sanitized"),
-        (LLMConnectionError("Unable to reach AI service"),
-         "connection error should be sanitized"),
-    ]
-
-    for error_exception, description in error_scenarios:
-        with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-            # Mock get_ai_response to raise the error
-            mock_get_ai.side_effect = error_exception
-
-            # Make request
-            response = client.post(
-                "/api/v1/messages",
-                json={"message": "Test message"}
-            )
-
-            # Verify error response exists
-            assert response.status_code in [400, 503, 504], \
-                f"Expected error status code, got {response.status_code}"
-
-            data = response.json()
-            # Error fields should be at top level, not wrapped in "detail"
-            assert "error" in data, f"Error response must include 'error' field at top level. Got: {data}"
-            assert "status" in data, f"Error response must include 'status' field. Got: {data}"
-            assert data["status"] == "error", f"Status should be 'error'. Got: {data['status']}"
-
-            error_msg = data["error"].lower()
-
-            # CRITICAL: Must NOT expose API keys
-            assert "sk-" not in data["error"], \
-                f"Error must not expose API keys: {description}"
-
-            # CRITICAL: Must NOT expose organization IDs
-            assert "org-" not in data["error"], \
-                f"Error must not expose org IDs: {description}"
-
-            # CRITICAL: Must NOT expose raw URLs
-            assert "https://" not in error_msg, \
-                f"Error must not expose API URLs: {description}"
-
-            # CRITICAL: Must NOT expose raw exception messages
-            assert "exception" not in error_msg, \
-                f"Error must not expose raw exceptions: {description}"
-
-            # Verify message is user-friendly (not technical)
-            assert any(word in error_msg for word in [
-                "service", "unavailable", "error", "busy", "configuration", "timeout"
-            ]), f"Error message should be user-friendly: {data['error']}"
@@ -10,15 +10,34 @@ Tests: T013
 
 import pytest
 import asyncio
-import time
-import json
-from unittest.mock import Mock, patch, AsyncMock
-from fastapi.testclient import TestClient
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_end_to_end_streaming_flow(client: TestClient):
+import httpx
+from unittest.mock import Mock, AsyncMock
+
+from src.schemas import CompleteEvent, ErrorEvent, TokenEvent
+from tests.helpers.sse import ListAsyncIterator, aparse_sse_stream
+
+pytestmark = [pytest.mark.integration, pytest.mark.sse, pytest.mark.asyncio]
+
+# Mock events shared across tests, built once per module. model_construct
+# skips validation (the values are fixed test data); the route still
+# serializes every event, so the SSE encoding remains under test.
+GREETING_TOKENS = ["Hello", " ", "world", "!", " ", "How", " ", "are", " ", "you", "?"]
+GREETING_EVENTS = [TokenEvent.model_construct(content=token) for token in GREETING_TOKENS]
+GREETING_COMPLETE_EVENT = CompleteEvent.model_construct(
+    model="gpt-3.5-turbo",
+    totalTokens=len(GREETING_TOKENS)
+)
+COMPLETE_EVENT = CompleteEvent.model_construct(model="gpt-3.5-turbo")
+
+# Unique token events for each of the concurrent streams, indexed by stream
+NUM_CONCURRENT_STREAMS = 10
+CONCURRENT_STREAM_EVENTS = [
+    [TokenEvent.model_construct(content=f"Token-{stream_id}-{i} ") for i in range(5)]
+    for stream_id in range(1, NUM_CONCURRENT_STREAMS + 1)
+]
+
+
+async def test_end_to_end_streaming_flow(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
     """
     T013: Integration test for complete streaming flow.
 
@@ -31,56 +50,38 @@ async def test_end_to_end_streaming_flow(client: TestClient):
 
     Feature: 009-message-streaming User Story 1
     """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        # Mock streaming response
-        async def mock_generator():
-            from src.schemas import TokenEvent, CompleteEvent
-            # Simulate realistic streaming with multiple tokens
-            tokens = ["Hello", " ", "world", "!", " ", "How", " ", "are", " ", "you", "?"]
-            for token in tokens:
-                yield TokenEvent(content=token)
-            yield CompleteEvent(model="gpt-3.5-turbo", totalTokens=len(tokens))
-
-        mock_stream.return_value = mock_generator()
-
-        # Make streaming request
-        response = client.post(
-            "/api/v1/messages",
-            json={"message": "Test streaming"},
-            headers={"Accept": "text/event-stream"}
-        )
+    # Mock streaming response: realistic streaming with multiple tokens
+    mock_stream_ai.return_value = ListAsyncIterator(GREETING_EVENTS + [GREETING_COMPLETE_EVENT])
 
-        # Verify response
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("Content-Type", "")
+    # Make streaming request
+    response = await async_client.post(
+        "/api/v1/messages",
+        json={"message": "Test streaming"},
+        headers={"Accept": "text/event-stream"}
+    )
 
-        # Parse events
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
+    # Verify response
+    assert response.status_code == 200
+    assert "text/event-stream" in response.headers.get("Content-Type", "")
 
-        # Verify event sequence
-        assert len(events) == 12  # 11 tokens + 1 complete
+    # Parse events
+    events = await aparse_sse_stream(response)
 
-        # Verify token events
-        token_events = [e for e in events if e["type"] == "token"]
-        assert len(token_events) == 11
+    # Verify event sequence
+    assert len(events) == 12  # 11 tokens + 1 complete
 
-        # Reconstruct message from tokens
-        message = "".join(e["content"] for e in token_events)
-        assert message == "Hello world! How are you?"
+    # Verify token events
+    token_events = [e for e in events if e["type"] == "token"]
+    assert [e["content"] for e in token_events] == GREETING_TOKENS
 
-        # Verify complete event
-        complete_event = events[-1]
-        assert complete_event["type"] == "complete"
-        assert complete_event["model"] == "gpt-3.5-turbo"
-        assert complete_event["totalTokens"] == 11
+    # Verify complete event
+    complete_event = events[-1]
+    assert complete_event["type"] == "complete"
+    assert complete_event["model"] == "gpt-3.5-turbo"
+    assert complete_event["totalTokens"] == 11
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_with_conversation_history(client: TestClient):
+async def test_streaming_with_conversation_history(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
     """
     T013: Integration test for streaming with conversation history.
 
@@ -89,54 +90,50 @@ async def test_streaming_with_conversation_history(client: TestClient):
 
     Feature: 009-message-streaming User Story 1
     """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        # Track arguments passed to stream_ai_response
-        captured_args = {}
+    # Track arguments passed to stream_ai_response
+    captured_args = {}
 
-        async def mock_generator(**kwargs):
-            # Capture arguments
-            captured_args.update(kwargs)
+    async def mock_generator(**kwargs):
+        # Capture arguments
+        captured_args.update(kwargs)
 
-            from src.schemas import TokenEvent, CompleteEvent
-            yield TokenEvent(content="Your")
-            yield TokenEvent(content=" name")
-            yield TokenEvent(content=" is")
-            yield TokenEvent(content=" Alice")
-            yield CompleteEvent(model="gpt-3.5-turbo")
+        yield TokenEvent(content="Your")
+        yield TokenEvent(content=" name")
+        yield TokenEvent(content=" is")
+        yield TokenEvent(content=" Alice")
+        yield COMPLETE_EVENT
 
-        mock_stream.side_effect = mock_generator
+    mock_stream_ai.side_effect = mock_generator
 
-        # Make request with conversation history
-        response = client.post(
-            "/api/v1/messages",
-            json={
-                "message": "What's my name?",
-                "history": [
-                    {"sender": "user", "text": "My name is Alice"},
-                    {"sender": "system", "text": "Nice to meet you, Alice!"}
-                ]
-            },
-            headers={"Accept": "text/event-stream"}
-        )
+    # Make request with conversation history
+    response = await async_client.post(
+        "/api/v1/messages",
+        json={
+            "message": "What's my name?",
+            "history": [
+                {"sender": "user", "text": "My name is Alice"},
+                {"sender": "system", "text": "Nice to meet you, Alice!"}
+            ]
+        },
+        headers={"Accept": "text/event-stream"}
+    )
 
-        # Verify response
-        assert response.status_code == 200
+    # Verify response
+    assert response.status_code == 200
 
-        # Verify history was passed to stream_ai_response
-        assert "history" in captured_args
-        assert len(captured_args["history"]) == 2
-        assert captured_args["history"][0]["sender"] == "user"
-        assert captured_args["history"][0]["text"] == "My name is Alice"
-        assert captured_args["history"][1]["sender"] == "system"
-        assert captured_args["history"][1]["text"] == "Nice to meet you, Alice!"
+    # Verify history was passed to stream_ai_response
+    assert "history" in captured_args
+    assert len(captured_args["history"]) == 2
+    assert captured_args["history"][0]["sender"] == "user"
+    assert captured_args["history"][0]["text"] == "My name is Alice"
+    assert captured_args["history"][1]["sender"] == "system"
+    assert captured_args["history"][1]["text"] == "Nice to meet you, Alice!"
 
-        # Verify message was passed
-        assert captured_args["message"] == "What's my name?"
+    # Verify message was passed
+    assert captured_args["message"] == "What's my name?"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_with_custom_model(client: TestClient):
+async def test_streaming_with_custom_model(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
     """
     T013: Integration test for streaming with per-request model selection.
 
@@ -145,48 +142,41 @@ async def test_streaming_with_custom_model(client: TestClient):
 
     Feature: 009-message-streaming + 008-openai-model-selector
     """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        # Track arguments
-        captured_args = {}
+    # Track arguments
+    captured_args = {}
 
-        async def mock_generator(**kwargs):
-            captured_args.update(kwargs)
+    async def mock_generator(**kwargs):
+        captured_args.update(kwargs)
 
-            from src.schemas import TokenEvent, CompleteEvent
-            yield TokenEvent(content="GPT-4 response")
-            yield CompleteEvent(model="gpt-4")
+        yield TokenEvent(content="GPT-4 response")
+        yield CompleteEvent(model="gpt-4")
 
-        mock_stream.side_effect = mock_generator
+    mock_stream_ai.side_effect = mock_generator
 
-        # Make request with custom model
-        response = client.post(
-            "/api/v1/messages",
-            json={
-                "message": "Test message",
-                "model": "gpt-4"
-            },
-            headers={"Accept": "text/event-stream"}
-        )
+    # Make request with custom model
+    response = await async_client.post(
+        "/api/v1/messages",
+        json={
+            "message": "Test message",
+            "model": "gpt-4"
+        },
+        headers={"Accept": "text/event-stream"}
+    )
 
-        # Verify response
-        assert response.status_code == 200
+    # Verify response
+    assert response.status_code == 200
 
-        # Verify model was passed to stream_ai_response
-        assert captured_args["model"] == "gpt-4"
+    # Verify model was passed to stream_ai_response
+    assert captured_args["model"] == "gpt-4"
 
-        # Parse events and verify CompleteEvent has correct model
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
+    # Parse events and verify CompleteEvent has correct model
+    events = await aparse_sse_stream(response)
 
-        complete_event = [e for e in events if e["type"] == "complete"][0]
-        assert complete_event["model"] == "gpt-4"
+    complete_event = [e for e in events if e["type"] == "complete"][0]
+    assert complete_event["model"] == "gpt-4"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_concurrent_streaming_requests(client: TestClient):
+async def test_concurrent_streaming_requests(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
     """
     T013: Integration test for concurrent streaming requests.
 
@@ -196,114 +186,100 @@ async def test_concurrent_streaming_requests(client: TestClient):
     Feature: 009-message-streaming User Story 1
     Success Criteria: Support at least 10 concurrent streams
     """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        request_count = 0
-
-        async def mock_generator(**kwargs):
-            nonlocal request_count
-            request_count += 1
-            request_id = request_count
-
-            from src.schemas import TokenEvent, CompleteEvent
-            # Each stream has unique content
-            for i in range(5):
-                yield TokenEvent(content=f"Token-{request_id}-{i} ")
-            yield CompleteEvent(model="gpt-3.5-turbo")
-
-        mock_stream.side_effect = lambda **kwargs: mock_generator(**kwargs)
-
-        # Make 10 concurrent requests
-        num_concurrent = 10
-        responses = []
-
-        for i in range(num_concurrent):
-            response = client.post(
-                "/api/v1/messages",
-                json={"message": f"Concurrent test {i}"},
-                headers={"Accept": "text/event-stream"}
-            )
-            responses.append(response)
-
-        # Verify all requests succeeded
-        assert len(responses) == num_concurrent
-        for i, response in enumerate(responses):
-            assert response.status_code == 200, f"Request {i} failed with status {response.status_code}"
-            assert "text/event-stream" in response.headers.get("Content-Type", "")
-
-        # Verify each stream has content
-        for i, response in enumerate(responses):
-            events = []
-            for event_str in response.text.split("\n\n"):
-                if event_str.strip() and event_str.startswith("data: "):
-                    events.append(json.loads(event_str[6:]))
-
-            # Should have tokens + complete event
-            assert len(events) >= 2, f"Stream {i} has too few events"
-
-            # Should have at least one token event
-            token_events = [e for e in events if e["type"] == "token"]
-            assert len(token_events) > 0, f"Stream {i} has no token events"
-
-            # Should have exactly one complete event
-            complete_events = [e for e in events if e["type"] == "complete"]
-            assert len(complete_events) == 1, f"Stream {i} has {len(complete_events)} complete events"
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_performance_first_token_latency(client: TestClient):
-    """
-    T013: Integration test for streaming performance - first token latency.
+    request_count = 0
 
-    Measures the time to receive the first token in a streaming response.
-
-    Feature: 009-message-streaming User Story 1
-    Success Criteria: First token visible within 1 second
-    """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        async def mock_generator():
-            from src.schemas import TokenEvent, CompleteEvent
-            # Simulate realistic LLM streaming with small delays
-            yield TokenEvent(content="First")
-            await asyncio.sleep(0.01)  # Simulate token generation time
-            yield TokenEvent(content=" token")
-            yield CompleteEvent(model="gpt-3.5-turbo")
+    async def mock_generator(**kwargs):
+        nonlocal request_count
+        request_count += 1
+        request_id = request_count
 
-        mock_stream.return_value = mock_generator()
+        # Each stream has unique content
+        for event in CONCURRENT_STREAM_EVENTS[request_id - 1]:
+            yield event
+        yield COMPLETE_EVENT
 
-        # Measure time to first byte
-        start_time = time.time()
+    mock_stream_ai.side_effect = mock_generator
 
-        response = client.post(
+    # Make 10 concurrent requests on the test's event loop
+    num_concurrent = NUM_CONCURRENT_STREAMS
+    responses = await asyncio.gather(*(
+        async_client.post(
             "/api/v1/messages",
-            json={"message": "Performance test"},
+            json={"message": f"Concurrent test {i}"},
             headers={"Accept": "text/event-stream"}
         )
+        for i in range(num_concurrent)
+    ))
+
+    # Token contents of each precomputed stream, mapped to its row index
+    expected_rows = {
+        tuple(event.content for event in row): row_index
+        for row_index, row in enumerate(CONCURRENT_STREAM_EVENTS)
+    }
+
+    # Verify every request succeeded and received one whole stream, in one pass
+    assert len(responses) == num_concurrent
+    received_rows = set()
+    for i, response in enumerate(responses):
+        assert response.status_code == 200, f"Request {i} failed with status {response.status_code}"
+        assert "text/event-stream" in response.headers.get("Content-Type", "")
+
+        events = await aparse_sse_stream(response)
+
+        # Should have tokens + complete event
+        assert len(events) >= 2, f"Stream {i} has too few events"
+
+        # Tokens must be exactly one precomputed stream, not a mix of streams
+        token_contents = tuple(e["content"] for e in events if e["type"] == "token")
+        assert token_contents in expected_rows, f"Stream {i} has interleaved tokens: {token_contents}"
+        received_rows.add(expected_rows[token_contents])
+
+        # Should have exactly one complete event
+        complete_events = [e for e in events if e["type"] == "complete"]
+        assert len(complete_events) == 1, f"Stream {i} has {len(complete_events)} complete events"
+
+    # No two responses carried the same stream
+    assert len(received_rows) == num_concurrent
+
+
+async def test_streaming_performance_first_token_latency(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
+    """
+    T013: Integration test for streaming performance - first token latency.
+
+    Validates that a stream whose first token is followed by further tokens
+    is delivered in full, starting with that first token.
 
-        # Time when we receive response (first token already sent)
-        first_token_time = time.time() - start_time
+    Time to first token is not asserted: the ASGI transport buffers the whole
+    response body, so a wall-clock threshold here would only measure total
+    response time.
 
-        # Verify response succeeded
-        assert response.status_code == 200
+    Feature: 009-message-streaming User Story 1
+    Success Criteria: First token visible within 1 second
+    """
+    mock_stream_ai.return_value = ListAsyncIterator([
+        TokenEvent(content="First"),
+        TokenEvent(content=" token"),
+        COMPLETE_EVENT,
+    ])
+
+    response = await async_client.post(
+        "/api/v1/messages",
+        json={"message": "Performance test"},
+        headers={"Accept": "text/event-stream"}
+    )
 
-        # Parse events
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
+    # Verify response succeeded
+    assert response.status_code == 200
 
-        # Verify we got events
-        assert len(events) >= 2
+    # Parse events
+    events = await aparse_sse_stream(response)
 
-        # Performance assertion: First token latency should be under 1 second
-        # Note: This is measuring total response time with TestClient, not streaming latency
-        # In production, first token would arrive immediately, but TestClient reads full response
-        assert first_token_time < 2.0, f"First token latency too high: {first_token_time:.3f}s"
+    # First token leads the stream, which ends with the complete event
+    assert [e["type"] for e in events] == ["token", "token", "complete"]
+    assert events[0]["content"] == "First"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_error_handling_in_pipeline(client: TestClient):
+async def test_streaming_error_handling_in_pipeline(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
     """
     T013: Integration test for error handling in streaming pipeline.
 
@@ -312,46 +288,41 @@ async def test_streaming_error_handling_in_pipeline(client: TestClient):
 
     Feature: 009-message-streaming User Story 3
     """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        async def mock_generator():
-            from src.schemas import TokenEvent, ErrorEvent
-            # Stream some tokens, then error
-            yield TokenEvent(content="Hello")
-            yield TokenEvent(content=" world")
-            # Simulate error mid-stream
-            yield ErrorEvent(error="AI service is busy", code="RATE_LIMIT")
-
-        mock_stream.return_value = mock_generator()
-
-        # Make streaming request
-        response = client.post(
-            "/api/v1/messages",
-            json={"message": "Test error handling"},
-            headers={"Accept": "text/event-stream"}
-        )
+    # Stream some tokens, then simulate an error mid-stream
+    mock_stream_ai.return_value = ListAsyncIterator([
+        TokenEvent(content="Hello"),
+        TokenEvent(content=" world"),
+        ErrorEvent(error="AI service is busy", code="RATE_LIMIT"),
+    ])
+
+    # Make streaming request
+    response = await async_client.post(
+        "/api/v1/messages",
+        json={"message": "Test error handling"},
+        headers={"Accept": "text/event-stream"}
+    )
 
-        # Verify response (should still be 200 since connection was established)
-        assert response.status_code == 200
+    # Verify response (should still be 200 since connection was established)
+    assert response.status_code == 200
 
-        # Parse events
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
+    # Parse events
+    events = await aparse_sse_stream(response)
 
-        # Verify we got token events followed by error event
-        assert len(events) == 3  # 2 tokens + 1 error
+    # Verify we got token events followed by error event
+    assert len(events) == 3  # 2 tokens + 1 error
 
-        # Verify error event
-        error_event = events[-1]
-        assert error_event["type"] == "error"
-        assert error_event["code"] == "RATE_LIMIT"
-        assert "busy" in error_event["error"].lower()
+    # Verify error event
+    error_event = events[-1]
+    assert error_event["type"] == "error"
+    assert error_event["code"] == "RATE_LIMIT"
+    assert "busy" in error_event["error"].lower()
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_backward_compatibility(client: TestClient):
+async def test_streaming_backward_compatibility(
+    async_client: httpx.AsyncClient,
+    mock_get_ai: AsyncMock,
+    mock_stream_ai: Mock
+):
     """
     T013: Integration test for backward compatibility with non-streaming.
 
@@ -361,53 +332,48 @@ async def test_streaming_backward_compatibility(client: TestClient):
     Feature: 009-message-streaming User Story 1
     CRITICAL: Ensures existing clients are not broken
     """
-    with patch('src.api.routes.messages.get_ai_response', new_callable=AsyncMock) as mock_get_ai:
-        # Mock non-streaming response
-        mock_get_ai.return_value = ("Hello World!", "gpt-3.5-turbo")
+    # Mock non-streaming response
+    mock_get_ai.return_value = ("Hello World!", "gpt-3.5-turbo")
 
-        # Test 1: Request with Accept: application/json (non-streaming)
-        response_json = client.post(
-            "/api/v1/messages",
-            json={"message": "Test"},
-            headers={"Accept": "application/json"}
-        )
+    # Test 1: Request with Accept: application/json (non-streaming)
+    response_json = await async_client.post(
+        "/api/v1/messages",
+        json={"message": "Test"},
+        headers={"Accept": "application/json"}
+    )
 
-        assert response_json.status_code == 200
-        assert "application/json" in response_json.headers.get("Content-Type", "")
+    assert response_json.status_code == 200
+    assert "application/json" in response_json.headers.get("Content-Type", "")
 
-        data = response_json.json()
-        assert data["status"] == "success"
-        assert data["message"] == "Hello World!"
-        assert "timestamp" in data
+    data = response_json.json()
+    assert data["status"] == "success"
+    assert data["message"] == "Hello World!"
+    assert "timestamp" in data
 
-        # Verify get_ai_response was called (not stream_ai_response)
-        mock_get_ai.assert_called_once()
+    # Verify get_ai_response was called (not stream_ai_response)
+    mock_get_ai.assert_called_once()
 
     # Test 2: Request with Accept: text/event-stream (streaming)
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        async def mock_generator():
-            from src.schemas import TokenEvent, CompleteEvent
-            yield TokenEvent(content="Streaming")
-            yield CompleteEvent(model="gpt-3.5-turbo")
-
-        mock_stream.return_value = mock_generator()
+    mock_stream_ai.return_value = ListAsyncIterator([
+        TokenEvent(content="Streaming"),
+        COMPLETE_EVENT,
+    ])
 
-        response_stream = client.post(
-            "/api/v1/messages",
-            json={"message": "Test"},
-            headers={"Accept": "text/event-stream"}
-        )
+    response_stream = await async_client.post(
+        "/api/v1/messages",
+        json={"message": "Test"},
+        headers={"Accept": "text/event-stream"}
+    )
 
-        assert response_stream.status_code == 200
-        assert "text/event-stream" in response_stream.headers.get("Content-Type", "")
+    assert response_stream.status_code == 200
+    assert "text/event-stream" in response_stream.headers.get("Content-Type", "")
 
-        # Verify response is SSE format (not JSON)
-        assert response_stream.text.startswith("data: ")
+    # Verify response is SSE format (not JSON)
+    assert response_stream.text.startswith("data: ")
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_with_empty_message_validation(client: TestClient):
+@pytest.mark.validation
+async def test_streaming_with_empty_message_validation(async_client: httpx.AsyncClient):
     """
     T013: Integration test for validation in streaming flow.
 
@@ -416,7 +382,7 @@ async def test_streaming_with_empty_message_validation(client: TestClient):
     Feature: 009-message-streaming User Story 1
     """
     # Test empty message (should fail validation before streaming starts)
-    response = client.post(
+    response = await async_client.post(
         "/api/v1/messages",
         json={"message": ""},
         headers={"Accept": "text/event-stream"}
@@ -426,9 +392,7 @@ async def test_streaming_with_empty_message_validation(client: TestClient):
     assert response.status_code == 422
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_streaming_special_characters_preservation(client: TestClient):
+async def test_streaming_special_characters_preservation(async_client: httpx.AsyncClient, mock_stream_ai: Mock):
     """
     T013: Integration test for special character preservation in streaming.
 
@@ -437,41 +401,28 @@ async def test_streaming_special_characters_preservation(client: TestClient):
 
     Feature: 009-message-streaming User Story 1
     """
-    with patch('src.api.routes.messages.stream_ai_response') as mock_stream:
-        async def mock_generator():
-            from src.schemas import TokenEvent, CompleteEvent
-            # Stream tokens with special characters
-            yield TokenEvent(content="🚀")
-            yield TokenEvent(content=" Hello ")
-            yield TokenEvent(content="世界")
-            yield TokenEvent(content=" @#$%")
-            yield CompleteEvent(model="gpt-3.5-turbo")
-
-        mock_stream.return_value = mock_generator()
-
-        # Make streaming request
-        response = client.post(
-            "/api/v1/messages",
-            json={"message": "Test special chars"},
-            headers={"Accept": "text/event-stream"}
-        )
+    # Stream tokens with special characters
+    mock_stream_ai.return_value = ListAsyncIterator([
+        TokenEvent(content="🚀"),
+        TokenEvent(content=" Hello "),
+        TokenEvent(content="世界"),
+        TokenEvent(content=" @#$%"),
+        COMPLETE_EVENT,
+    ])
+
+    # Make streaming request
+    response = await async_client.post(
+        "/api/v1/messages",
+        json={"message": "Test special chars"},
+        headers={"Accept": "text/event-stream"}
+    )
+
+    # Verify response
+    assert response.status_code == 200
+
+    # Parse events
+    events = await aparse_sse_stream(response)
 
-        # Verify response
-        assert response.status_code == 200
-
-        # Parse events
-        events = []
-        for event_str in response.text.split("\n\n"):
-            if event_str.strip() and event_str.startswith("data: "):
-                events.append(json.loads(event_str[6:]))
-
-        # Verify special characters are preserved
-        token_events = [e for e in events if e["type"] == "token"]
-        assert token_events[0]["content"] == "🚀"
-        assert token_events[1]["content"] == " Hello "
-        assert token_events[2]["content"] == "世界"
-        assert token_events[3]["content"] == " @#$%"
-
-        # Reconstruct full message
-        full_message = "".join(e["content"] for e in token_events)
-        assert full_message == "🚀 Hello 世界 @#$%"
+    # Verify special characters are preserved
+    token_events = [e for e in events if e["type"] == "token"]
+    assert [e["content"] for e in token_events] == ["🚀", " Hello ", "世界", " @#$%"]
@@ -7,76 +7,94 @@ Feature: 012-modular-model-providers
 Task: T033 - Provider test template base class
 """
 
-from abc import ABC, abstractmethod
-from typing import Type
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import ClassVar, NamedTuple, Type
 import pytest
 
 
-class BaseProviderTestMixin(ABC):
+class ProviderSpec(NamedTuple):
+    """
+    Provider a test module covers, as read by the fixtures in conftest.py.
+
+    Each provider test module returns one of these from its provider_spec
+    fixture.
+    """
+
+    provider_class: Type  # The provider class to test
+    chat_class_path: str  # The path to the chat model class for mocking
+    api_key_env: str  # The environment variable name for the API key
+
+
+def status_response(status_code: int) -> SimpleNamespace:
+    """
+    Build the HTTP response an SDK APIStatusError is constructed with.
+
+    The openai and anthropic APIStatusError constructors only read
+    status_code, headers and request, so a plain namespace is enough.
+    """
+    return SimpleNamespace(status_code=status_code, headers={}, request=None)
+
+
+class BaseProviderTestMixin:
     """
     T033: Base test mixin for provider implementations.
 
     Provides a reusable template for testing provider implementations.
-    Concrete test classes should inherit from this mixin and implement
-    the abstract methods.
+    Concrete test classes should inherit from this mixin and set the
+    required class attributes; a subclass missing any of them raises
+    TypeError when it is defined.
 
     Usage:
-        class TestOpenAIProvider(BaseProviderTestMixin):
+        class TestOpenAIProviderContract(BaseProviderTestMixin):
             provider_class = OpenAIProvider
             chat_class_path = 'src.services.providers.openai.ChatOpenAI'
             api_key_env = 'OPENAI_API_KEY'
             expected_provider_id = 'openai'
             expected_provider_name = 'OpenAI'
+            sample_model_id = 'gpt-3.5-turbo'
     """
 
-    # Abstract properties that must be defined by subclasses
-    @property
-    @abstractmethod
-    def provider_class(self) -> Type:
-        """The provider class to test."""
-        pass
-
-    @property
-    @abstractmethod
-    def chat_class_path(self) -> str:
-        """The path to the chat model class for mocking."""
-        pass
-
-    @property
-    @abstractmethod
-    def api_key_env(self) -> str:
-        """The environment variable name for the API key."""
-        pass
-
-    @property
-    @abstractmethod
-    def expected_provider_id(self) -> str:
-        """The expected provider ID."""
-        pass
-
-    @property
-    @abstractmethod
-    def expected_provider_name(self) -> str:
-        """The expected provider display name."""
-        pass
-
-    @property
-    @abstractmethod
-    def sample_model_id(self) -> str:
-        """A sample model ID for testing."""
-        pass
-
-    def test_provider_id_property(self):
+    # Class attributes that must be defined by subclasses
+    provider_class: ClassVar[Type]  # The provider class to test
+    chat_class_path: ClassVar[str]  # The path to the chat model class for mocking
+    api_key_env: ClassVar[str]  # The environment variable name for the API key
+    expected_provider_id: ClassVar[str]  # The expected provider ID
+    expected_provider_name: ClassVar[str]  # The expected provider display name
+    sample_model_id: ClassVar[str]  # A sample model ID for testing
+
+    _REQUIRED_ATTRIBUTES = (
+        'provider_class',
+        'chat_class_path',
+        'api_key_env',
+        'expected_provider_id',
+        'expected_provider_name',
+        'sample_model_id',
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        missing = [name for name in cls._REQUIRED_ATTRIBUTES if not hasattr(cls, name)]
+        if missing:
+            raise TypeError(f"{cls.__name__} must set {', '.join(missing)}")
+
+    @pytest.fixture(scope="class")
+    def provider_spec(self) -> ProviderSpec:
+        """Point the shared conftest fixtures at this class's provider."""
+        return ProviderSpec(self.provider_class, self.chat_class_path, self.api_key_env)
+
+    @pytest.fixture(scope="class")
+    def provider(self):
+        """Provider instance shared by the tests of one concrete class."""
+        return self.provider_class()
+
+    def test_provider_id_property(self, provider):
         """Test that provider_id returns the expected value."""
-        provider = self.provider_class()
         assert provider.provider_id == self.expected_provider_id
 
-    def test_get_config_returns_provider_config(self):
+    def test_get_config_returns_provider_config(self, provider):
         """Test that get_config returns a ProviderConfig instance."""
         from src.services.providers.base import ProviderConfig
 
-        provider = self.provider_class()
         config = provider.get_config()
 
         assert isinstance(config, ProviderConfig)
@@ -84,22 +102,19 @@ class BaseProviderTestMixin(ABC):
         assert config.name == self.expected_provider_name
         assert config.api_key_env == self.api_key_env
 
-    def test_create_llm_raises_error_when_api_key_missing(self):
+    def test_create_llm_raises_error_when_api_key_missing(self, no_api_key):
         """Test that create_llm raises error when API key is missing."""
         from src.services.providers.base import LLMAuthenticationError
 
-        with patch.dict('os.environ', {}, clear=True):
-            provider = self.provider_class()
+        provider = self.provider_class()
 
-            with pytest.raises(LLMAuthenticationError):
-                provider.create_llm(self.sample_model_id)
+        with pytest.raises(LLMAuthenticationError):
+            provider.create_llm(self.sample_model_id)
 
-    def test_implements_base_provider_protocol(self):
+    def test_implements_base_provider_protocol(self, provider):
         """Test that provider implements BaseProvider protocol."""
         from src.services.providers.base import BaseProvider
 
-        provider = self.provider_class()
-
         # Check all required attributes exist
         assert hasattr(provider, 'provider_id')
         assert hasattr(provider, 'create_llm')
@@ -111,4 +126,4 @@ class BaseProviderTestMixin(ABC):
 
 
 # Export for use in tests
-__all__ = ['BaseProviderTestMixin']
+__all__ = ['BaseProviderTestMixin', 'ProviderSpec', 'status_response']
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for provider unit tests.
+
+Each provider test module defines a module-scoped provider_spec fixture;
+the fixtures below read the provider class, the chat model patch target
+and the API key variable from it.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from . import ProviderSpec
+
+
+@pytest.fixture
+def api_key(monkeypatch: pytest.MonkeyPatch, provider_spec: ProviderSpec) -> None:
+    """Set the provider's API key variable for the duration of a test."""
+    monkeypatch.setenv(provider_spec.api_key_env, 'test-key')
+
+
+@pytest.fixture
+def no_api_key(monkeypatch: pytest.MonkeyPatch, provider_spec: ProviderSpec) -> None:
+    """Remove the provider's API key variable for the duration of a test."""
+    monkeypatch.delenv(provider_spec.api_key_env, raising=False)
+
+
+@pytest.fixture
+def patched_chat_class(monkeypatch: pytest.MonkeyPatch, provider_spec: ProviderSpec) -> Mock:
+    """
+    Replace the chat model class the provider instantiates in create_llm().
+
+    Returns:
+        Mock class whose return_value is the LLM that create_llm() returns
+    """
+    mock_chat = Mock()
+    monkeypatch.setattr(provider_spec.chat_class_path, mock_chat)
+    return mock_chat
+
+
+@pytest.fixture(scope="module")
+def provider(provider_spec: ProviderSpec):
+    """Provider instance shared by tests that do not depend on the environment."""
+    return provider_spec.provider_class()
@@ -9,15 +9,48 @@ Task: T024
 """
 
 import pytest
-from unittest.mock import Mock, patch
-import os
+from unittest.mock import Mock
+
+from anthropic import (
+    APIConnectionError,
+    APITimeoutError,
+    AuthenticationError,
+    BadRequestError,
+    InternalServerError,
+    NotFoundError,
+    PermissionDeniedError,
+    RateLimitError,
+)
+
+from src.services.llm_service import (
+    LLMAuthenticationError,
+    LLMBadRequestError,
+    LLMConnectionError,
+    LLMRateLimitError,
+    LLMServiceError,
+    LLMTimeoutError,
+)
+from src.services.providers.anthropic import AnthropicProvider
+from src.services.providers.base import BaseProvider, ProviderConfig
+
+from . import BaseProviderTestMixin, ProviderSpec, status_response
+
+
+@pytest.fixture(scope="module")
+def provider_spec():
+    """Point the shared provider fixtures at AnthropicProvider."""
+    return ProviderSpec(
+        provider_class=AnthropicProvider,
+        chat_class_path='src.services.providers.anthropic.ChatAnthropic',
+        api_key_env='ANTHROPIC_API_KEY',
+    )
 
 
 @pytest.mark.unit
 class TestAnthropicProviderCreateLLM:
     """Tests for AnthropicProvider.create_llm() method."""
 
-    def test_create_llm_returns_chat_anthropic_instance(self):
+    def test_create_llm_returns_chat_anthropic_instance(self, api_key, patched_chat_class):
         """
         T024: create_llm() returns a ChatAnthropic instance.
 
@@ -26,254 +59,105 @@ class TestAnthropicProviderCreateLLM:
         - Correct model ID is passed
         - Correct API key is used
         """
-        from src.services.providers.anthropic import AnthropicProvider
-
-        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
-            with patch('src.services.providers.anthropic.ChatAnthropic') as mock_chat:
-                mock_instance = Mock()
-                mock_chat.return_value = mock_instance
-
-                provider = AnthropicProvider()
-                llm = provider.create_llm("claude-3-5-sonnet-20241022")
+        provider = AnthropicProvider()
+        llm = provider.create_llm("claude-3-5-sonnet-20241022")
 
-                mock_chat.assert_called_once_with(
-                    api_key="test-key",
-                    model="claude-3-5-sonnet-20241022",
-                    timeout=120
-                )
-                assert llm == mock_instance
+        patched_chat_class.assert_called_once_with(
+            api_key="test-key",
+            model="claude-3-5-sonnet-20241022",
+            timeout=120
+        )
+        assert llm == patched_chat_class.return_value
 
-    def test_create_llm_raises_error_when_api_key_missing(self):
+    def test_create_llm_raises_error_when_api_key_missing(self, no_api_key):
         """
         T024: create_llm() raises LLMAuthenticationError when API key missing.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMAuthenticationError
-
-        with patch.dict('os.environ', {}, clear=True):
-            provider = AnthropicProvider()
+        provider = AnthropicProvider()
 
-            with pytest.raises(LLMAuthenticationError, match="Anthropic API key not configured"):
-                provider.create_llm("claude-3-5-sonnet-20241022")
+        with pytest.raises(LLMAuthenticationError, match="Anthropic API key not configured"):
+            provider.create_llm("claude-3-5-sonnet-20241022")
 
-    def test_create_llm_with_different_models(self):
+    def test_create_llm_with_different_models(self, api_key, patched_chat_class):
         """
         T024: create_llm() works with different model IDs.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-
-        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
-            with patch('src.services.providers.anthropic.ChatAnthropic') as mock_chat:
-                mock_chat.return_value = Mock()
-
-                provider = AnthropicProvider()
+        provider = AnthropicProvider()
 
-                # Test with claude-3-5-sonnet
-                provider.create_llm("claude-3-5-sonnet-20241022")
-                call_args = mock_chat.call_args
-                assert call_args.kwargs['model'] == "claude-3-5-sonnet-20241022"
+        # Test with claude-3-5-sonnet
+        provider.create_llm("claude-3-5-sonnet-20241022")
+        call_args = patched_chat_class.call_args
+        assert call_args.kwargs['model'] == "claude-3-5-sonnet-20241022"
 
-                mock_chat.reset_mock()
+        patched_chat_class.reset_mock()
 
-                # Test with claude-3-haiku
-                provider.create_llm("claude-3-haiku-20240307")
-                call_args = mock_chat.call_args
-                assert call_args.kwargs['model'] == "claude-3-haiku-20240307"
+        # Test with claude-3-haiku
+        provider.create_llm("claude-3-haiku-20240307")
+        call_args = patched_chat_class.call_args
+        assert call_args.kwargs['model'] == "claude-3-haiku-20240307"
 
 
 @pytest.mark.unit
 class TestAnthropicProviderMapError:
     """Tests for AnthropicProvider.map_error() method."""
 
-    def test_map_error_authentication_error(self):
-        """
-        T024: map_error() maps AuthenticationError to LLMAuthenticationError.
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMAuthenticationError
-        from anthropic import AuthenticationError
-
-        provider = AnthropicProvider()
-
-        mock_response = Mock()
-        mock_response.status_code = 401
-        original = AuthenticationError(
-            "Invalid API key",
-            response=mock_response,
-            body={"error": {"message": "Invalid"}}
+    @pytest.mark.parametrize(
+        "error_class,status_code,message,expected_class,expected_text",
+        [
+            (AuthenticationError, 401, "Invalid API key", LLMAuthenticationError, None),
+            (RateLimitError, 429, "Rate limit exceeded", LLMRateLimitError, None),
+            (BadRequestError, 400, "Bad request", LLMBadRequestError, None),
+            # A missing model is a client-side error (bad request)
+            (NotFoundError, 404, "Model not found", LLMBadRequestError, "not found"),
+            # 403 is an auth/permissions issue
+            (PermissionDeniedError, 403, "Permission denied", LLMAuthenticationError, "denied"),
+            # 500 is a server-side issue
+            (InternalServerError, 500, "Internal server error", LLMServiceError, "unavailable"),
+        ],
+        ids=["authentication", "rate_limit", "bad_request", "not_found",
+             "permission_denied", "internal_server"]
+    )
+    def test_map_error_status_error(
+        self, provider, error_class, status_code, message, expected_class, expected_text
+    ):
+        """
+        T024: map_error() maps Anthropic HTTP status errors to LLM service errors.
+        """
+        original = error_class(
+            message,
+            response=status_response(status_code),
+            body={"error": {"message": message}}
         )
 
         mapped = provider.map_error(original)
 
-        assert isinstance(mapped, LLMAuthenticationError)
+        assert isinstance(mapped, expected_class)
+        if expected_text is not None:
+            assert expected_text in mapped.message.lower()
         assert mapped.original_error == original
 
-    def test_map_error_rate_limit_error(self):
+    @pytest.mark.parametrize(
+        "error_class,expected_class",
+        [
+            (APITimeoutError, LLMTimeoutError),
+            (APIConnectionError, LLMConnectionError),
+        ],
+        ids=["timeout", "connection"]
+    )
+    def test_map_error_request_error(self, provider, error_class, expected_class):
         """
-        T024: map_error() maps RateLimitError to LLMRateLimitError.
+        T024: map_error() maps Anthropic request errors to LLM service errors.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMRateLimitError
-        from anthropic import RateLimitError
-
-        provider = AnthropicProvider()
-
-        mock_response = Mock()
-        mock_response.status_code = 429
-        original = RateLimitError(
-            "Rate limit exceeded",
-            response=mock_response,
-            body={"error": {"message": "Rate limit"}}
-        )
-
+        original = error_class(request=Mock())
         mapped = provider.map_error(original)
 
-        assert isinstance(mapped, LLMRateLimitError)
+        assert isinstance(mapped, expected_class)
         assert mapped.original_error == original
 
-    def test_map_error_timeout_error(self):
-        """
-        T024: map_error() maps APITimeoutError to LLMTimeoutError.
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMTimeoutError
-        from anthropic import APITimeoutError
-
-        provider = AnthropicProvider()
-
-        original = APITimeoutError(request=Mock())
-        mapped = provider.map_error(original)
-
-        assert isinstance(mapped, LLMTimeoutError)
-        assert mapped.original_error == original
-
-    def test_map_error_connection_error(self):
-        """
-        T024: map_error() maps APIConnectionError to LLMConnectionError.
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMConnectionError
-        from anthropic import APIConnectionError
-
-        provider = AnthropicProvider()
-
-        original = APIConnectionError(request=Mock())
-        mapped = provider.map_error(original)
-
-        assert isinstance(mapped, LLMConnectionError)
-        assert mapped.original_error == original
-
-    def test_map_error_bad_request_error(self):
-        """
-        T024: map_error() maps BadRequestError to LLMBadRequestError.
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMBadRequestError
-        from anthropic import BadRequestError
-
-        provider = AnthropicProvider()
-
-        mock_response = Mock()
-        mock_response.status_code = 400
-        original = BadRequestError(
-            "Bad request",
-            response=mock_response,
-            body={"error": {"message": "Bad"}}
-        )
-
-        mapped = provider.map_error(original)
-
-        assert isinstance(mapped, LLMBadRequestError)
-        assert mapped.original_error == original
-
-    def test_map_error_not_found_error(self):
-        """
-        T024: map_error() maps NotFoundError to LLMBadRequestError.
-
-        NotFoundError (404) is typically a model not found, which is
-        a client-side error (bad request).
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMBadRequestError
-        from anthropic import NotFoundError
-
-        provider = AnthropicProvider()
-
-        mock_response = Mock()
-        mock_response.status_code = 404
-        original = NotFoundError(
-            "Model not found",
-            response=mock_response,
-            body={"error": {"message": "Not found"}}
-        )
-
-        mapped = provider.map_error(original)
-
-        assert isinstance(mapped, LLMBadRequestError)
-        assert "not found" in mapped.message.lower()
-        assert mapped.original_error == original
-
-    def test_map_error_permission_denied_error(self):
-        """
-        T024: map_error() maps PermissionDeniedError to LLMAuthenticationError.
-
-        PermissionDeniedError (403) is an auth/permissions issue.
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMAuthenticationError
-        from anthropic import PermissionDeniedError
-
-        provider = AnthropicProvider()
-
-        mock_response = Mock()
-        mock_response.status_code = 403
-        original = PermissionDeniedError(
-            "Permission denied",
-            response=mock_response,
-            body={"error": {"message": "Forbidden"}}
-        )
-
-        mapped = provider.map_error(original)
-
-        assert isinstance(mapped, LLMAuthenticationError)
-        assert "denied" in mapped.message.lower()
-        assert mapped.original_error == original
-
-    def test_map_error_internal_server_error(self):
-        """
-        T024: map_error() maps InternalServerError to LLMServiceError.
-
-        InternalServerError (500) is a server-side issue.
-        """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMServiceError
-        from anthropic import InternalServerError
-
-        provider = AnthropicProvider()
-
-        mock_response = Mock()
-        mock_response.status_code = 500
-        original = InternalServerError(
-            "Internal server error",
-            response=mock_response,
-            body={"error": {"message": "Server error"}}
-        )
-
-        mapped = provider.map_error(original)
-
-        assert isinstance(mapped, LLMServiceError)
-        assert "unavailable" in mapped.message.lower()
-        assert mapped.original_error == original
-
-    def test_map_error_unknown_error(self):
+    def test_map_error_unknown_error(self, provider):
         """
         T024: map_error() maps unknown errors to generic LLMServiceError.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.llm_service import LLMServiceError
-
-        provider = AnthropicProvider()
-
         original = ValueError("Some unexpected error")
         mapped = provider.map_error(original)
 
@@ -285,14 +169,10 @@ class TestAnthropicProviderMapError:
 class TestAnthropicProviderGetConfig:
     """Tests for AnthropicProvider.get_config() method."""
 
-    def test_get_config_returns_provider_config(self):
+    def test_get_config_returns_provider_config(self, provider):
         """
         T024: get_config() returns a ProviderConfig instance.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.providers.base import ProviderConfig
-
-        provider = AnthropicProvider()
         config = provider.get_config()
 
         assert isinstance(config, ProviderConfig)
@@ -301,54 +181,39 @@ class TestAnthropicProviderGetConfig:
         assert config.api_key_env == "ANTHROPIC_API_KEY"
         assert config.models_env == "ANTHROPIC_MODELS"
 
-    def test_get_config_enabled_when_api_key_present(self):
+    def test_get_config_enabled_when_api_key_present(self, api_key):
         """
         T024: get_config().is_enabled() returns True when API key is set.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-
-        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
-            provider = AnthropicProvider()
-            config = provider.get_config()
+        provider = AnthropicProvider()
+        config = provider.get_config()
 
-            assert config.is_enabled() is True
+        assert config.is_enabled() is True
 
-    def test_get_config_disabled_when_api_key_missing(self):
+    def test_get_config_disabled_when_api_key_missing(self, no_api_key):
         """
         T024: get_config().is_enabled() returns False when API key is missing.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-
-        with patch.dict('os.environ', {}, clear=True):
-            provider = AnthropicProvider()
-            config = provider.get_config()
+        provider = AnthropicProvider()
+        config = provider.get_config()
 
-            assert config.is_enabled() is False
+        assert config.is_enabled() is False
 
 
 @pytest.mark.unit
 class TestAnthropicProviderProperties:
     """Tests for AnthropicProvider properties."""
 
-    def test_provider_id_property(self):
+    def test_provider_id_property(self, provider):
         """
         T024: provider_id property returns 'anthropic'.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-
-        provider = AnthropicProvider()
-
         assert provider.provider_id == "anthropic"
 
-    def test_implements_base_provider_protocol(self):
+    def test_implements_base_provider_protocol(self, provider):
         """
         T024: AnthropicProvider implements BaseProvider protocol.
         """
-        from src.services.providers.anthropic import AnthropicProvider
-        from src.services.providers.base import BaseProvider
-
-        provider = AnthropicProvider()
-
         # Check it has all required methods/properties
         assert hasattr(provider, 'provider_id')
         assert hasattr(provider, 'create_llm')
@@ -357,3 +222,15 @@ class TestAnthropicProviderProperties:
 
         # Verify it passes isinstance check with Protocol
         assert isinstance(provider, BaseProvider)
+
+
+@pytest.mark.unit
+class TestAnthropicProviderContract(BaseProviderTestMixin):
+    """Runs the shared provider template tests against AnthropicProvider."""
+
+    provider_class = AnthropicProvider
+    chat_class_path = 'src.services.providers.anthropic.ChatAnthropic'
+    api_key_env = 'ANTHROPIC_API_KEY'
+    expected_provider_id = 'anthropic'
+    expected_provider_name = 'Anthropic'
+    sample_model_id = 'claude-3-5-sonnet-20241022'
@@ -0,0 +1,103 @@
+"""
+Unit tests for the SseDecoder test helper
+
+Tests incremental decoding of SSE bodies: events split across chunks,
+CRLF line endings, multi-line data fields and flushing an unterminated
+final event.
+"""
+
+import pytest
+
+from tests.helpers.sse import SseDecoder
+
+
+@pytest.mark.unit
+class TestSseDecoderFeed:
+    """Test SseDecoder.feed() event framing"""
+
+    def test_decodes_complete_event(self):
+        """Test a single complete event is decoded on feed"""
+        decoder = SseDecoder()
+
+        assert decoder.feed(b'data: {"type": "token"}\n\n') == [{"type": "token"}]
+
+    def test_event_split_across_chunks(self):
+        """Test an event split across feed() calls is decoded once complete"""
+        decoder = SseDecoder()
+
+        assert decoder.feed(b'data: {"type": "tok') == []
+        assert decoder.feed(b'en"}\n') == []
+        assert decoder.feed(b'\n') == [{"type": "token"}]
+
+    def test_multiple_events_in_one_chunk(self):
+        """Test every event completed by a chunk is returned in order"""
+        decoder = SseDecoder()
+
+        events = decoder.feed(b'data: {"n": 1}\n\ndata: {"n": 2}\n\ndata: {"n": 3}')
+
+        assert events == [{"n": 1}, {"n": 2}]
+        assert decoder.flush() == [{"n": 3}]
+
+    @pytest.mark.parametrize("chunks", [
+        pytest.param([b'data: {"n": 1}\r\n\r\ndata: {"n": 2}\r\n\r\n'], id="one-chunk"),
+        pytest.param([b'data: {"n": 1}\r', b'\n\r', b'\ndata: {"n": 2}\r\n\r\n'], id="split-crlf"),
+    ])
+    def test_crlf_line_endings(self, chunks):
+        """Test CRLF line endings frame events, including a CRLF split across chunks"""
+        decoder = SseDecoder()
+
+        events = []
+        for chunk in chunks:
+            events.extend(decoder.feed(chunk))
+
+        assert events == [{"n": 1}, {"n": 2}]
+
+    def test_bare_cr_line_endings(self):
+        """Test bare CR line endings frame events"""
+        decoder = SseDecoder()
+
+        assert decoder.feed(b'data: {"n": 1}\r\r') == []
+        assert decoder.feed(b'data: {"n": 2}\r\r') == [{"n": 1}]
+        assert decoder.flush() == [{"n": 2}]
+
+    def test_multiline_data_fields_are_joined(self):
+        """Test consecutive data lines are joined with newlines before decoding"""
+        decoder = SseDecoder()
+
+        events = decoder.feed(b'data: {"type": "token",\ndata: "content": "Hi"}\n\n')
+
+        assert events == [{"type": "token", "content": "Hi"}]
+
+    def test_non_data_fields_and_comments_ignored(self):
+        """Test event, id and comment lines are ignored"""
+        decoder = SseDecoder()
+
+        events = decoder.feed(b': keep-alive\n\nevent: token\nid: 1\ndata: {"n": 1}\n\n')
+
+        assert events == [{"n": 1}]
+
+
+@pytest.mark.unit
+class TestSseDecoderFlush:
+    """Test SseDecoder.flush() at end of stream"""
+
+    def test_flush_without_trailing_blank_line(self):
+        """Test flush decodes a final event with no terminating blank line"""
+        decoder = SseDecoder()
+
+        assert decoder.feed(b'data: {"type": "complete"}') == []
+        assert decoder.flush() == [{"type": "complete"}]
+
+    def test_flush_with_trailing_cr(self):
+        """Test flush decodes a final event ending in a held-back CR"""
+        decoder = SseDecoder()
+
+        assert decoder.feed(b'data: {"type": "complete"}\r') == []
+        assert decoder.flush() == [{"type": "complete"}]
+
+    def test_flush_empty_buffer(self):
+        """Test flush returns nothing once every event has been consumed"""
+        decoder = SseDecoder()
+        decoder.feed(b'data: {"n": 1}\n\n')
+
+        assert decoder.flush() == []